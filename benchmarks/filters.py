@@ -0,0 +1,641 @@
+"""Microbenchmarks for the filters of the Copier extension.
+
+Every filter registered by the extension is timed on small, medium and large inputs
+and the results are written to a JSON file, so that runs can be compared:
+
+    python -m benchmarks.filters --output results.json
+    python -m benchmarks.filters --output new.json --compare results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+from functools import cache
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import Timer
+from typing import TYPE_CHECKING
+from typing import Any
+
+from jinja2 import Environment
+
+from jinja2_copier_extension import CopierExtension
+from jinja2_copier_extension.extension import _filters
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Sequence
+    from typing import TypeAlias
+
+# A filter input: the value to filter, positional and keyword arguments.
+Input: TypeAlias = "tuple[Any, tuple[Any, ...], dict[str, Any]]"
+
+SIZES = {"small": 1_000, "medium": 1_000_000, "large": 50_000_000}
+ALL_SIZES = tuple(SIZES)
+SMALL = ("small",)
+
+
+@dataclass(frozen=True)
+class Case:
+    """A benchmark case for a filter."""
+
+    name: str
+    filter: str
+    sizes: tuple[str, ...]
+    build: Callable[[int], Input]
+    configure: Callable[[Environment], None] | None = None
+    consume: bool = False
+
+
+CASES: list[Case] = []
+
+
+def case(
+    filter_name: str,
+    sizes: tuple[str, ...] = ALL_SIZES,
+    *,
+    name: str | None = None,
+    configure: Callable[[Environment], None] | None = None,
+    consume: bool = False,
+) -> Callable[
+    [Callable[[int], Input]],
+    Callable[[int], Input],
+]:
+    """Register a function building the filter input for a size as benchmark case."""
+
+    def decorator(
+        build: Callable[[int], Input],
+    ) -> Callable[[int], Input]:
+        CASES.append(
+            Case(
+                name=name or filter_name,
+                filter=filter_name,
+                sizes=sizes,
+                build=build,
+                configure=configure,
+                consume=consume,
+            ),
+        )
+        return build
+
+    return decorator
+
+
+def _disable_parse_cache(env: Environment) -> None:
+    env.copier_parse_cache.maxsize = 0  # type: ignore[attr-defined]
+
+
+def _disable_file_hash_cache(env: Environment) -> None:
+    env.copier_file_hash_cache.maxsize = 0  # type: ignore[attr-defined]
+
+
+def _disable_random_state_cache(env: Environment) -> None:
+    env.copier_random_state_cache.maxsize = 0  # type: ignore[attr-defined]
+
+
+def _enable_render_clock(env: Environment) -> None:
+    env.copier_render_clock = True  # type: ignore[attr-defined]
+
+
+def _use_python_json_backend(env: Environment) -> None:
+    _disable_parse_cache(env)
+    env.copier_json_backend = "python"  # type: ignore[attr-defined]
+
+
+def _enable_path_cache(env: Environment) -> None:
+    env.copier_path_cache.maxsize = 1024  # type: ignore[attr-defined]
+
+
+# Input data
+
+
+@cache
+def _text(size: int) -> str:
+    words = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod\n"
+    return (words * (size // len(words) + 1))[:size]
+
+
+@cache
+def _file(size: int) -> str:
+    path = Path(f"file-{size}.txt")
+    path.write_text(_text(size))
+    return path.as_posix()
+
+
+@cache
+def _records(size: int) -> list[dict[str, Any]]:
+    # Each record is roughly 100 bytes when serialized as JSON.
+    return [
+        {
+            "id": i,
+            "name": f"item-{i}",
+            "group": f"group-{i % 10}",
+            "enabled": i % 2 == 0,
+            "ratio": i / 7,
+            "tags": ["a", "b"],
+        }
+        for i in range(max(size // 100, 1))
+    ]
+
+
+@cache
+def _document(size: int) -> dict[str, Any]:
+    return {"items": _records(size)}
+
+
+@cache
+def _json_text(size: int) -> str:
+    return json.dumps(_document(size))
+
+
+@cache
+def _jsonl_text(size: int) -> str:
+    return "".join(f"{json.dumps(record)}\n" for record in _records(size))
+
+
+@cache
+def _jsonl_file(size: int) -> str:
+    path = Path(f"file-{size}.jsonl")
+    path.write_text(_jsonl_text(size))
+    return path.as_posix()
+
+
+@cache
+def _yaml_text(size: int) -> str:
+    import yaml  # noqa: PLC0415
+
+    dumper = getattr(yaml, "CDumper", yaml.Dumper)
+    return yaml.dump(_document(size), Dumper=dumper)
+
+
+@cache
+def _nested(size: int) -> list[Any]:
+    # Deep nesting bounded by the recursion limit, with the breadth growing with size.
+    depth = {1_000: 10, 1_000_000: 100, 50_000_000: 500}.get(size, 10)
+    breadth = max(size // (depth * 10), 1)
+    nested: list[Any] = list(range(breadth))
+    for level in range(depth):
+        nested = [level, None, nested, list(range(breadth))]
+    return nested
+
+
+@cache
+def _file_tree(size: int) -> str:
+    root = Path(f"tree-{size}")
+    files = {1_000: 10, 1_000_000: 1_000, 50_000_000: 20_000}.get(size, 10)
+    for i in range(files):
+        path = root / f"d{i % 10}" / f"s{i % 100}" / f"f{i}.{'txt' if i % 2 else 'md'}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    return root.as_posix()
+
+
+# Cases
+
+
+@case("ans_groupby")
+def _(size: int) -> Input:
+    return _records(size), ("group",), {}
+
+
+@case("ans_random", SMALL)
+@case(
+    "ans_random",
+    SMALL,
+    name="ans_random[uncached]",
+    configure=_disable_random_state_cache,
+)
+def _(size: int) -> Input:
+    return 1_000, (), {"seed": "project"}
+
+
+@case("b64decode")
+def _(size: int) -> Input:
+    from base64 import b64encode  # noqa: PLC0415
+
+    return b64encode(_text(size).encode()).decode(), (), {}
+
+
+@case("b64encode")
+def _(size: int) -> Input:
+    return _text(size), (), {}
+
+
+@case("basename", SMALL)
+@case("dirname", SMALL)
+@case("expanduser", SMALL)
+@case("expandvars", SMALL)
+@case("realpath", SMALL)
+@case("realpath", SMALL, name="realpath[cached]", configure=_enable_path_cache)
+@case("splitext", SMALL)
+def _(size: int) -> Input:
+    return "~/projects/${PROJECT}/src/package/module.py", (), {}
+
+
+@case("relpath", SMALL)
+def _(size: int) -> Input:
+    return "/srv/projects/app/src/package/module.py", ("/srv/projects/lib",), {}
+
+
+@case("win_basename", SMALL)
+@case("win_dirname", SMALL)
+@case("win_splitdrive", SMALL)
+def _(size: int) -> Input:
+    return "C:\\Users\\jane\\projects\\app\\module.py", (), {}
+
+
+@case("bool", SMALL)
+def _(size: int) -> Input:
+    return "yes", (), {}
+
+
+@case("bool", SMALL, name="bool[int]")
+def _(size: int) -> Input:
+    return 1, (), {}
+
+
+@case("bool", SMALL, name="bool[number]")
+def _(size: int) -> Input:
+    return "1.5", (), {}
+
+
+@case("bool", SMALL, name="bool[other]")
+def _(size: int) -> Input:
+    return "maybe", (), {}
+
+
+@case("bool_each")
+def _(size: int) -> Input:
+    values = ["yes", "no", "1", "0", True, None, "maybe", 2.5]
+    return [values[i % len(values)] for i in range(size // 100)], (), {}
+
+
+@case("checksum")
+@case("hash")
+@case("md5")
+@case("sha1")
+@case("quote")
+@case("regex_escape")
+def _(size: int) -> Input:
+    return _text(size), (), {}
+
+
+@case("digest")
+def _(size: int) -> Input:
+    return _document(size), (), {}
+
+
+@case("to_json", name="to_json[sort_keys]")
+def _(size: int) -> Input:
+    return _document(size), (), {"sort_keys": True}
+
+
+@case("to_json", SMALL, name="to_json[scalar]")
+@case("to_nice_json", SMALL, name="to_nice_json[scalar]")
+def _(_size: int) -> Input:
+    return "value", (), {}
+
+
+@case("hash_chunks")
+@case("hash_each")
+def _(size: int) -> Input:
+    return [_text(size // 100) + str(i) for i in range(100)], (), {}
+
+
+@case("hash_file", configure=_disable_file_hash_cache)
+@case("md5_file", configure=_disable_file_hash_cache)
+@case("sha1_file", configure=_disable_file_hash_cache)
+@case("hash_file", name="hash_file[cached]")
+def _(size: int) -> Input:
+    return _file(size), (), {}
+
+
+@case("extract", SMALL)
+def _(size: int) -> Input:
+    return "a", ({"a": {"b": {"c": 1}}},), {"morekeys": ["b", "c"]}
+
+
+@case("fileglob")
+def _(size: int) -> Input:
+    return f"{_file_tree(size)}/**/*.txt", (), {}
+
+
+@case("fileglob", name="fileglob[limit]")
+def _(size: int) -> Input:
+    return f"{_file_tree(size)}/**/*.txt", (), {"limit": 10}
+
+
+@case("fileglob", name="fileglob[cached]", configure=_enable_path_cache)
+@case("fileglob", name="fileglob[exclude]")
+def _(size: int) -> Input:
+    return f"{_file_tree(size)}/**/*.txt", (), {"exclude": ["d[1-9]/", "*.md"]}
+
+
+@case("flatten")
+def _(size: int) -> Input:
+    return _nested(size), (), {}
+
+
+@case("from_json", configure=_disable_parse_cache)
+@case("from_json", name="from_json[python]", configure=_use_python_json_backend)
+def _(size: int) -> Input:
+    return _json_text(size), (), {}
+
+
+@case("from_json", name="from_json[cached]")
+def _(size: int) -> Input:
+    return _json_text(size), (), {}
+
+
+@case("from_jsonl", consume=True)
+def _(size: int) -> Input:
+    return _jsonl_text(size), (), {}
+
+
+@case("from_jsonl", name="from_jsonl[path]", consume=True)
+def _(size: int) -> Input:
+    return _jsonl_file(size), (), {"path": True}
+
+
+@case("from_yaml", configure=_disable_parse_cache)
+@case("from_yaml_all", configure=_disable_parse_cache, consume=True)
+def _(size: int) -> Input:
+    return _yaml_text(size), (), {}
+
+
+@case("from_yaml", name="from_yaml[cached]")
+def _(size: int) -> Input:
+    return _yaml_text(size), (), {}
+
+
+@case("mandatory", SMALL)
+@case("type_debug", SMALL)
+def _(size: int) -> Input:
+    return "value", (), {}
+
+
+@case("random_mac", SMALL)
+@case(
+    "random_mac",
+    SMALL,
+    name="random_mac[uncached]",
+    configure=_disable_random_state_cache,
+)
+def _(size: int) -> Input:
+    return "52:54:00", (), {"seed": "project"}
+
+
+@case("regex_findall")
+def _(size: int) -> Input:
+    return _text(size), (r"\b[a-z]{5}\b",), {}
+
+
+@case("regex_replace")
+def _(size: int) -> Input:
+    return _text(size), (r"(\w+) (\w+)", r"\2 \1"), {}
+
+
+@case("regex_search")
+def _(size: int) -> Input:
+    return _text(size), (r"(?P<word>e\w+)\s*$",), {"multiline": False}
+
+
+# NOTE: A short string with a single repeated pattern measures the per-call overhead,
+# which is dominated by looking up the compiled pattern in the cache.
+@case("regex_findall", SMALL, name="regex_findall[short]")
+def _(size: int) -> Input:
+    return "foo bar 123", (r"\d+",), {}
+
+
+@case("regex_replace", SMALL, name="regex_replace[short]")
+def _(size: int) -> Input:
+    return "foo bar 123", (r"\d+", "x"), {}
+
+
+@case("regex_search", SMALL, name="regex_search[short]")
+def _(size: int) -> Input:
+    return "foo bar 123", (r"\d+",), {}
+
+
+@case("regex_replace", name="regex_replace[list]")
+def _(size: int) -> Input:
+    return _text(size).splitlines(), (r"(\w+) (\w+)", r"\2 \1"), {}
+
+
+@case("regex_search", SMALL, name="regex_search[backrefs]")
+def _(size: int) -> Input:
+    pattern = r"^(?P<dividend>[0-9]+)/(?P<divisor>[0-9]+)$"
+    return "2/3", (pattern, r"\g<dividend>", r"\g<divisor>", r"\1"), {}
+
+
+@case("random_mac_pool")
+def _(size: int) -> Input:
+    return "52:54:00", (size // 1_000,), {"seed": "project"}
+
+
+@case("random_sample")
+def _(size: int) -> Input:
+    return 65_536, (size // 1_000,), {"seed": "project"}
+
+
+@case("shuffle")
+def _(size: int) -> Input:
+    return list(range(size // 10)), (), {"seed": "project"}
+
+
+@case("strftime", SMALL)
+@case("strftime", SMALL, name="strftime[render_clock]", configure=_enable_render_clock)
+def _(size: int) -> Input:
+    return "%Y-%m-%d %H:%M:%S", (), {}
+
+
+@case("strftime", SMALL, name="strftime[timestamp]")
+def _(size: int) -> Input:
+    return "%Y-%m-%d %H:%M:%S", (1_700_000_000,), {}
+
+
+@case("ternary", SMALL)
+def _(size: int) -> Input:
+    return True, ("yes", "no"), {}
+
+
+@case("to_datetime", SMALL)
+def _(size: int) -> Input:
+    return "2016-08-14 20:00:12", (), {}
+
+
+@case("to_datetime", SMALL, name="to_datetime[numeric]")
+def _(size: int) -> Input:
+    return "14/08/2016 20:00", ("%d/%m/%Y %H:%M",), {}
+
+
+@case("to_datetime", name="to_datetime[list]")
+def _(size: int) -> Input:
+    return [f"2016-08-14 20:{i % 60:02d}:12" for i in range(size // 100)], (), {}
+
+
+@case("to_json")
+@case("to_nice_json")
+@case("to_nice_yaml")
+@case("to_yaml")
+def _(size: int) -> Input:
+    return _document(size), (), {}
+
+
+@case("to_uuid")
+def _(size: int) -> Input:
+    return _text(size), (), {}
+
+
+@case("to_uuid", name="to_uuid[list]")
+def _(size: int) -> Input:
+    return [f"resource-{i % 100}" for i in range(size // 100)], (), {}
+
+
+# Runner
+
+
+def _check_coverage() -> None:
+    missing = sorted(set(_filters) - {c.filter for c in CASES})
+    if missing:
+        msg = f"Filters without benchmark cases: {', '.join(missing)}"
+        raise RuntimeError(msg)
+
+
+def run_case(case: Case, size: str, repeat: int) -> dict[str, Any]:
+    """Time a benchmark case for a size.
+
+    Args:
+        case: A benchmark case.
+        size: The name of the input size.
+        repeat: The number of timing repetitions.
+
+    Returns:
+        The benchmark result.
+    """
+    env = Environment(extensions=[CopierExtension])
+    if case.configure is not None:
+        case.configure(env)
+    value, args, kwargs = case.build(SIZES[size])
+
+    def call() -> None:
+        result = env.call_filter(case.filter, value, args, kwargs)
+        if case.consume:
+            list(result)
+
+    timer = Timer(call)
+    number, _ = timer.autorange()
+    timings = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "case": case.name,
+        "filter": case.filter,
+        "size": size,
+        "number": number,
+        "best": min(timings),
+        "timings": timings,
+    }
+
+
+def _compare(results: list[dict[str, Any]], baseline_path: Path) -> None:
+    baseline = {
+        (r["case"], r["size"]): r["best"]
+        for r in json.loads(baseline_path.read_text())["results"]
+    }
+    for result in results:
+        if (old := baseline.get((result["case"], result["size"]))) is not None:
+            ratio = result["best"] / old
+            sys.stdout.write(
+                f"{result['case']:<28} {result['size']:<7} {ratio:6.2f}x\n",
+            )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmarks.
+
+    Args:
+        argv: Command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("benchmark-results.json"),
+        help="JSON file to write the results to",
+    )
+    parser.add_argument(
+        "-s",
+        "--size",
+        action="append",
+        choices=ALL_SIZES,
+        help="input sizes to run (repeatable, default: small and medium)",
+    )
+    parser.add_argument(
+        "-k",
+        "--select",
+        default="",
+        help="regex selecting the benchmark cases to run",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of timing repetitions per case",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="JSON results of a previous run to compare against",
+    )
+    args = parser.parse_args(argv)
+    sizes = args.size or ["small", "medium"]
+    select = re.compile(args.select)
+    output = args.output.resolve()
+    baseline = args.compare.resolve() if args.compare else None
+
+    _check_coverage()
+    results = []
+    cwd = Path.cwd()
+    with TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            for bench in CASES:
+                if not select.search(bench.name):
+                    continue
+                for size in sizes:
+                    if size not in bench.sizes:
+                        continue
+                    result = run_case(bench, size, args.repeat)
+                    results.append(result)
+                    sys.stdout.write(
+                        f"{bench.name:<28} {size:<7} {result['best'] * 1e6:14.3f} us\n",
+                    )
+        finally:
+            os.chdir(cwd)
+
+    output.write_text(
+        json.dumps(
+            {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "python": sys.version,
+                "platform": platform.platform(),
+                "results": results,
+            },
+            indent=2,
+        ),
+    )
+    if baseline is not None:
+        _compare(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
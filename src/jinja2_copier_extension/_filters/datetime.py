@@ -2,40 +2,173 @@
 
 from __future__ import annotations
 
+import re
+import time
+from contextlib import suppress
 from datetime import datetime
+from functools import lru_cache
 from time import localtime
 from time import strftime
+from typing import TYPE_CHECKING
+from typing import Any
+
+from jinja2 import pass_environment
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from jinja2 import Environment
 
 __all__ = ["do_strftime", "do_to_datetime"]
 
+# Formats whose strings can be parsed with `datetime.fromisoformat` if they match the
+# strict pattern, which is a subset of what `datetime.strptime` accepts.
+_ISO_FORMAT_PATTERNS = {
+    format_: re.compile(pattern)
+    for format_, pattern in [
+        ("%Y-%m-%d", r"[0-9]{4}-[0-9]{2}-[0-9]{2}"),
+        ("%Y-%m-%d %H:%M", r"[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}"),
+        ("%Y-%m-%dT%H:%M", r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}"),
+        (
+            "%Y-%m-%d %H:%M:%S",
+            r"[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}",
+        ),
+        (
+            "%Y-%m-%dT%H:%M:%S",
+            r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}",
+        ),
+        (
+            "%Y-%m-%d %H:%M:%S.%f",
+            r"[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{6}",
+        ),
+        (
+            "%Y-%m-%dT%H:%M:%S.%f",
+            r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{6}",
+        ),
+    ]
+}
 
+# NOTE: These are the patterns of the numeric directives used by `datetime.strptime`
+# (see `_strptime.TimeRE`), along with the conversion of the matched values.
+_DIRECTIVES: dict[str, tuple[str, str, Callable[[str], int]]] = {
+    "d": (r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])", "day", int),
+    "f": (r"(?P<f>[0-9]{1,6})", "microsecond", lambda value: int(value.ljust(6, "0"))),
+    "H": (r"(?P<H>2[0-3]|[0-1]\d|\d)", "hour", int),
+    "m": (r"(?P<m>1[0-2]|0[1-9]|[1-9])", "month", int),
+    "M": (r"(?P<M>[0-5]\d|\d)", "minute", int),
+    "S": (r"(?P<S>6[0-1]|[0-5]\d|\d)", "second", int),
+    "y": (
+        r"(?P<y>\d\d)",
+        "year",
+        lambda value: int(value) + (2000 if int(value) <= 68 else 1900),  # noqa: PLR2004
+    ),
+    "Y": (r"(?P<Y>\d\d\d\d)", "year", int),
+}
+_REGEX_CHARS_PATTERN = re.compile(r"([\\.^$*+?\(\){}\[\]|])")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+@pass_environment
 def do_strftime(
+    environment: Environment,
     format: str,  # noqa: A002
     second: float | None = None,
 ) -> str:
     """Convert a Unix timestamp to a date/time string according to a date/time format.
 
     Args:
+        environment: A Jinja2 environment instance.
         format: A string that describes the expected date/time format.
-        second: Unix timestamp in local time. If `None`, the current time is used.
+        second:
+            Unix timestamp in local time. If `None`, the current time is used, or the
+            render time if the render clock is enabled.
 
     Returns:
         The formatted date/time string.
     """
+    if second is None and getattr(environment, "copier_render_clock", False):
+        second = getattr(environment, "copier_render_time", None)
+        if second is None:
+            second = time.time()
+            environment.copier_render_time = second  # type: ignore[attr-defined]
     return strftime(format, localtime(second))
 
 
 def do_to_datetime(
-    string: str,
+    string: str | list[str] | tuple[str, ...],
     format: str = "%Y-%m-%d %H:%M:%S",  # noqa: A002
-) -> datetime:
+) -> datetime | list[datetime]:
     """Convert a string containing date/time information to a `datetime` object.
 
+    The result is the same as with `datetime.strptime`, but ISO 8601 strings and
+    formats with numeric directives only are parsed faster.
+
     Args:
-        string: A string containing date/time information.
+        string:
+            A string containing date/time information, or a list or tuple of such
+            strings to convert each.
         format: A string that describes the expected date/time format of `string`.
 
     Returns:
-        The corresponding `datetime` object.
+        The corresponding `datetime` object, or a list of `datetime` objects for a
+        list or tuple of strings.
     """
+    if isinstance(string, (list, tuple)):
+        return [_to_datetime(item, format) for item in string]
+    return _to_datetime(string, format)
+
+
+def _to_datetime(string: str, format: str) -> datetime:  # noqa: A002
+    if isinstance(string, str):
+        iso_pattern = _ISO_FORMAT_PATTERNS.get(format)
+        if iso_pattern is not None and iso_pattern.fullmatch(string):
+            with suppress(ValueError):
+                return datetime.fromisoformat(string)
+        elif (pattern := _compile_format(format)) and (
+            match := pattern.fullmatch(string)
+        ):
+            with suppress(ValueError):
+                return _from_match(match)
+    # NOTE: `datetime.strptime` handles all other formats, and raises the errors for
+    # invalid strings.
     return datetime.strptime(string, format)  # noqa: DTZ007
+
+
+@lru_cache(maxsize=128)
+def _compile_format(format: str) -> re.Pattern[str] | None:  # noqa: A002
+    # Returns the pattern `datetime.strptime` uses for a format with numeric
+    # directives only, or `None` for other formats.
+    remaining = _WHITESPACE_PATTERN.sub(
+        r"\\s+",
+        _REGEX_CHARS_PATTERN.sub(r"\\\1", format),
+    )
+    parts: list[str] = []
+    directives: set[str] = set()
+    while (index := remaining.find("%")) >= 0:
+        directive = remaining[index + 1 : index + 2]
+        if directive == "%":
+            parts.append(remaining[: index + 1])
+        elif directive in _DIRECTIVES:
+            parts.extend((remaining[:index], _DIRECTIVES[directive][0]))
+            directives.add(directive)
+        else:
+            return None
+        remaining = remaining[index + 2 :]
+    parts.append(remaining)
+    # NOTE: `datetime.strptime` warns about a day of month without a year since
+    # Python 3.13, as the default year 1900 is not a leap year, so such formats are
+    # left to it.
+    if "d" in directives and not directives & {"Y", "y"}:
+        return None
+    try:
+        return re.compile("".join(parts), re.IGNORECASE)
+    except re.error:
+        return None
+
+
+def _from_match(match: re.Match[str]) -> datetime:
+    fields: dict[str, Any] = {"year": 1900, "month": 1, "day": 1}
+    for directive, value in match.groupdict().items():
+        _, field, convert = _DIRECTIVES[directive]
+        fields[field] = convert(value)
+    return datetime(**fields)  # noqa: DTZ001
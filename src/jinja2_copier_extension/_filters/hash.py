@@ -2,14 +2,59 @@
 
 from __future__ import annotations
 
-from hashlib import new
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
 
-__all__ = ["do_hash", "do_md5", "do_sha1"]
+from jinja2 import pass_environment
 
+if TYPE_CHECKING:
+    from _hashlib import HASH
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from concurrent.futures import Future
+    from os import PathLike
 
-def do_hash(data: str, algorithm: str = "sha1") -> str:
+    from jinja2 import Environment
+
+    from jinja2_copier_extension._utils import LRUCache
+
+__all__ = [
+    "do_digest",
+    "do_hash",
+    "do_hash_chunks",
+    "do_hash_each",
+    "do_hash_file",
+    "do_md5",
+    "do_md5_file",
+    "do_sha1",
+    "do_sha1_file",
+]
+
+_CHUNK_SIZE = 1024 * 1024
+# NOTE: hashlib releases the GIL while hashing data larger than 2047 bytes, but the
+# overhead of dispatching to a thread only pays off for much larger data.
+_PARALLEL_MIN_SIZE = 64 * 1024
+# NOTE: Containers with at most this many nested values are serialized in one go by
+# the C-accelerated JSON encoder, larger ones are walked item by item.
+_DIGEST_MAX_NODES = 256
+# NOTE: The serialized output is flushed into the hasher whenever the buffered text
+# reaches this many characters.
+_DIGEST_BUFFER_SIZE = 16 * 1024
+_canonical_json = json.JSONEncoder(sort_keys=True).encode
+
+
+def do_hash(data: str | bytes | bytearray | memoryview, algorithm: str = "sha1") -> str:
     """Hash data using a configurable algorithm.
 
+    Strings are UTF-8 encoded, other data is hashed as-is without copying it.
+
     Args:
         data: The data to hash.
         algorithm: The algorithm to use. Defaults to `"sha1"`.
@@ -17,12 +62,10 @@ def do_hash(data: str, algorithm: str = "sha1") -> str:
     Returns:
         The hashed data.
     """
-    hasher = new(algorithm)
-    hasher.update(data.encode())
-    return hasher.hexdigest()
+    return _hexdigest(_get_hasher_factory(algorithm), data)
 
 
-def do_md5(data: str) -> str:
+def do_md5(data: str | bytes | bytearray | memoryview) -> str:
     """Hash data using the MD5 algorithm.
 
     Args:
@@ -34,7 +77,7 @@ def do_md5(data: str) -> str:
     return do_hash(data, "md5")
 
 
-def do_sha1(data: str) -> str:
+def do_sha1(data: str | bytes | bytearray | memoryview) -> str:
     """Hash data using the SHA1 algorithm.
 
     Args:
@@ -44,3 +87,230 @@ def do_sha1(data: str) -> str:
         The hashed data.
     """
     return do_hash(data, "sha1")
+
+
+def do_hash_chunks(
+    data: Iterable[str | bytes | bytearray | memoryview],
+    algorithm: str = "sha1",
+) -> str:
+    """Hash a sequence of data chunks as a whole using a configurable algorithm.
+
+    The chunks are hashed incrementally, so the result equals the hash of their
+    concatenation without creating it.
+
+    Args:
+        data: A sequence of data chunks to hash.
+        algorithm: The algorithm to use. Defaults to `"sha1"`.
+
+    Returns:
+        The hashed data.
+    """
+    hasher = _get_hasher_factory(algorithm)()
+    if isinstance(data, (str, bytes, bytearray, memoryview)):
+        data = [data]
+    for chunk in data:
+        hasher.update(chunk.encode() if isinstance(chunk, str) else chunk)
+    return hasher.hexdigest()
+
+
+def do_hash_each(
+    data: Iterable[str | bytes | bytearray | memoryview],
+    algorithm: str = "sha1",
+) -> list[str]:
+    """Hash each item of a sequence of data using a configurable algorithm.
+
+    Large items are hashed in parallel threads, small items are hashed inline. A single
+    string or bytes-like object is hashed as a sequence of one item.
+
+    Args:
+        data: A sequence of data to hash.
+        algorithm: The algorithm to use. Defaults to `"sha1"`.
+
+    Returns:
+        The hashed data, one item per item of the sequence in the same order.
+    """
+    factory = _get_hasher_factory(algorithm)
+    items = (
+        [data] if isinstance(data, (str, bytes, bytearray, memoryview)) else list(data)
+    )
+    # NOTE: `len` counts the elements of a memoryview, not its bytes.
+    is_large = [
+        (item.nbytes if isinstance(item, memoryview) else len(item))
+        >= _PARALLEL_MIN_SIZE
+        for item in items
+    ]
+    large = sum(is_large)
+    if large < 2:  # noqa: PLR2004
+        return [_hexdigest(factory, item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(large, os.cpu_count() or 1)) as executor:
+        results: list[str | Future[str]] = [
+            executor.submit(_hexdigest, factory, item)
+            if item_is_large
+            else _hexdigest(factory, item)
+            for item, item_is_large in zip(items, is_large)
+        ]
+        return [
+            result if isinstance(result, str) else result.result() for result in results
+        ]
+
+
+def do_digest(data: Any, algorithm: str = "sha1") -> str:
+    """Hash structured data in a canonical form using a configurable algorithm.
+
+    The result equals `data | to_json(sort_keys=True) | hash(algorithm)`, but the
+    data is serialized and hashed incrementally without building the whole JSON
+    document in memory.
+
+    Args:
+        data: The data to hash.
+        algorithm: The algorithm to use. Defaults to `"sha1"`.
+
+    Returns:
+        The hashed data.
+
+    Raises:
+        ValueError: If the data contains a circular reference.
+    """
+    hasher = _get_hasher_factory(algorithm)()
+    buffer: list[str] = []
+    buffered = 0
+    markers: set[int] = set()
+
+    def emit(*parts: str) -> None:
+        nonlocal buffered
+        buffer.extend(parts)
+        buffered += sum(map(len, parts))
+        if buffered >= _DIGEST_BUFFER_SIZE:
+            hasher.update("".join(buffer).encode())
+            buffer.clear()
+            buffered = 0
+
+    def walk(obj: Any) -> None:
+        if (
+            not isinstance(obj, (dict, list, tuple))
+            or _count_nodes(obj, _DIGEST_MAX_NODES) >= 0
+        ):
+            emit(_canonical_json(obj))
+            return
+        if id(obj) in markers:
+            msg = "Circular reference detected"
+            raise ValueError(msg)
+        markers.add(id(obj))
+        if isinstance(obj, dict):
+            separator = "{"
+            for key in sorted(obj):
+                # NOTE: Encoding a single-item dict converts non-string keys like
+                # `json.dumps` does; `[1:-7]` strips the braces and `: null`.
+                emit(separator, _canonical_json({key: None})[1:-7], ": ")
+                separator = ", "
+                walk(obj[key])
+            emit("}")
+        else:
+            separator = "["
+            for value in obj:
+                emit(separator)
+                separator = ", "
+                walk(value)
+            emit("]")
+        markers.remove(id(obj))
+
+    walk(data)
+    hasher.update("".join(buffer).encode())
+    return hasher.hexdigest()
+
+
+@pass_environment
+def do_hash_file(
+    environment: Environment,
+    path: str | PathLike[str],
+    algorithm: str = "sha1",
+) -> str:
+    """Hash the contents of a file using a configurable algorithm.
+
+    The file is read in chunks, and the hash is cached until the size or modification
+    time of the file changes.
+
+    Args:
+        environment: A Jinja2 environment instance.
+        path: The path of the file to hash.
+        algorithm: The algorithm to use. Defaults to `"sha1"`.
+
+    Returns:
+        The hashed file contents.
+    """
+    file = Path(path).absolute()
+    stat = file.stat()
+    key = (str(file), stat.st_size, stat.st_mtime_ns, algorithm)
+    cache: LRUCache[tuple[str, int, int, str], str] | None = getattr(
+        environment,
+        "copier_file_hash_cache",
+        None,
+    )
+    if cache is not None and (digest := cache.get(key)) is not None:
+        return digest
+    hasher = _get_hasher_factory(algorithm)()
+    buffer = memoryview(bytearray(_CHUNK_SIZE))
+    with file.open("rb", buffering=0) as f:
+        while size := f.readinto(buffer):
+            hasher.update(buffer[:size])
+    digest = hasher.hexdigest()
+    if cache is not None:
+        cache.put(key, digest)
+    return digest
+
+
+@pass_environment
+def do_md5_file(environment: Environment, path: str | PathLike[str]) -> str:
+    """Hash the contents of a file using the MD5 algorithm.
+
+    Args:
+        environment: A Jinja2 environment instance.
+        path: The path of the file to hash.
+
+    Returns:
+        The hashed file contents.
+    """
+    return do_hash_file(environment, path, "md5")
+
+
+@pass_environment
+def do_sha1_file(environment: Environment, path: str | PathLike[str]) -> str:
+    """Hash the contents of a file using the SHA1 algorithm.
+
+    Args:
+        environment: A Jinja2 environment instance.
+        path: The path of the file to hash.
+
+    Returns:
+        The hashed file contents.
+    """
+    return do_hash_file(environment, path, "sha1")
+
+
+@lru_cache(maxsize=32)
+def _get_hasher_factory(algorithm: str) -> Callable[[], HASH]:
+    # NOTE: The named constructors (e.g. `hashlib.sha1`) are faster than `hashlib.new`.
+    if algorithm in hashlib.algorithms_guaranteed:
+        return getattr(hashlib, algorithm)  # type: ignore[no-any-return]
+    return partial(hashlib.new, algorithm)
+
+
+def _count_nodes(obj: dict[Any, Any] | list[Any] | tuple[Any, ...], budget: int) -> int:
+    # Returns the budget left after counting the nested values, or a negative number
+    # as soon as the budget is exhausted.
+    for value in obj.values() if isinstance(obj, dict) else obj:
+        budget -= 1
+        if isinstance(value, (dict, list, tuple)):
+            budget = _count_nodes(value, budget)
+        if budget < 0:
+            break
+    return budget
+
+
+def _hexdigest(
+    factory: Callable[[], HASH],
+    data: str | bytes | bytearray | memoryview,
+) -> str:
+    hasher = factory()
+    hasher.update(data.encode() if isinstance(data, str) else data)
+    return hasher.hexdigest()
@@ -3,22 +3,123 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 
-__all__ = ["do_from_json", "do_to_json", "do_to_nice_json"]
+from jinja2 import pass_environment
 
+from jinja2_copier_extension._utils import parse_cached
 
-def do_from_json(data: str, /, **kwargs: Any) -> Any:
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+    from os import PathLike
+
+    from jinja2 import Environment
+
+__all__ = ["do_from_json", "do_from_jsonl", "do_to_json", "do_to_nice_json"]
+
+# NOTE: Only deserialization is pluggable, as the serialized output of other backends
+# differs from `json.dumps` (separators, escaping of non-ASCII characters, floats).
+_BACKENDS: dict[str, Callable[[str], Any]] = {"python": json.loads}
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    pass
+else:
+    _BACKENDS["orjson"] = orjson.loads
+# NOTE: orjson returns integers beyond 64 bits as floats instead of rejecting them, so
+# data with a run of at least 19 digits (e.g. `-9223372036854775809`) is deserialized
+# by `json.loads`. The check maps all digits to `0`, which is much faster than a
+# regex search, and may also match strings or fractions, which only costs the speedup.
+_DIGIT_TABLE = bytes.maketrans(b"0123456789", b"0" * 10)
+_LARGE_INT_DIGITS = b"0" * 19
+
+
+def _get_backend(environment: Environment) -> tuple[str, Callable[[str], Any]]:
+    backend = getattr(environment, "copier_json_backend", "auto")
+    if backend == "auto":
+        backend = "orjson" if "orjson" in _BACKENDS else "python"
+    try:
+        return backend, _BACKENDS[backend]
+    except KeyError:
+        msg = f'JSON backend "{backend}" is not available'
+        raise ValueError(msg) from None
+
+
+@pass_environment
+def do_from_json(environment: Environment, data: str, /, **kwargs: Any) -> Any:
     """Deserialize JSON data.
 
+    The JSON backend is used unless keyword arguments are passed, which are only
+    supported by `json.loads`. Data the backend rejects or may deserialize differently
+    (integers beyond 64 bits) is deserialized by `json.loads` as well, so the known
+    differences between the backends do not affect the result. The parse cache is only
+    used for `json.loads`, as other backends are faster than restoring a snapshot.
+
     Args:
+        environment: A Jinja2 environment instance.
         data: JSON data to deserialize.
         **kwargs: Additional keyword arguments to pass to `json.loads`.
 
     Returns:
         Deserialized JSON data.
     """
-    return json.loads(data, **kwargs)
+    backend, loads = _get_backend(environment)
+    if kwargs or loads is json.loads:
+        return parse_cached(
+            environment,
+            ("json", backend, *sorted(kwargs.items())),
+            data,
+            lambda: json.loads(data, **kwargs),
+        )
+    # NOTE: Other backends are faster than restoring a cached snapshot.
+    return _loads_with_fallback(loads, data)
+
+
+@pass_environment
+def do_from_jsonl(
+    environment: Environment,
+    data: str | PathLike[str],
+    /,
+    *,
+    path: bool = False,
+    encoding: str = "utf-8",
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Deserialize JSON Lines data lazily.
+
+    The data is parsed one line at a time while iterating over the result, so large
+    strings or files are processed without keeping all records in memory. Blank lines
+    are skipped.
+
+    Args:
+        environment: A Jinja2 environment instance.
+        data: JSON Lines data to deserialize, or the path of a file containing it.
+        path: Whether a string is the path of a file. Defaults to `False`.
+        encoding: The encoding of the file. Defaults to `"utf-8"`.
+        **kwargs: Additional keyword arguments to pass to `json.loads`.
+
+    Returns:
+        Deserialized JSON data with one item per line.
+
+    Raises:
+        ValueError: If a line contains invalid JSON.
+    """
+    _, loads = _get_backend(environment)
+    parse: Callable[[str], Any]
+    if kwargs:
+        parse = partial(json.loads, **kwargs)
+    elif loads is json.loads:
+        parse = json.loads
+    else:
+        parse = partial(_loads_with_fallback, loads)
+    if path or not isinstance(data, str):
+        return _parse_lines(parse, _iter_file_lines(data, encoding))
+    return _parse_lines(parse, _iter_lines(data))
 
 
 def do_to_json(obj: Any, /, **kwargs: Any) -> str:
@@ -31,7 +132,7 @@ def do_to_json(obj: Any, /, **kwargs: Any) -> str:
     Returns:
         Serialized JSON data.
     """
-    return json.dumps(obj, **kwargs)
+    return _dumps(obj, kwargs)
 
 
 def do_to_nice_json(obj: Any, /, **kwargs: Any) -> str:
@@ -50,4 +151,80 @@ def do_to_nice_json(obj: Any, /, **kwargs: Any) -> str:
     kwargs.setdefault("allow_nan", True)
     kwargs.setdefault("indent", 4)
     kwargs.setdefault("sort_keys", True)
-    return json.dumps(obj, **kwargs)
+    return _dumps(obj, kwargs)
+
+
+def _loads_with_fallback(loads: Callable[[str], Any], data: str) -> Any:
+    # NOTE: Other backends reject some data that `json.loads` accepts (e.g. `NaN`),
+    # which is then deserialized by `json.loads` that also raises the errors for
+    # invalid data. Data with a byte order mark, which `json.loads` rejects, and data
+    # that may contain large integers are passed to it directly.
+    if (
+        isinstance(data, str)
+        and not data.startswith("\ufeff")
+        and _LARGE_INT_DIGITS
+        not in data.encode("utf-8", "surrogatepass").translate(_DIGIT_TABLE)
+    ):
+        try:
+            return loads(data)
+        except ValueError:
+            pass
+    return json.loads(data)
+
+
+def _parse_lines(parse: Callable[[str], Any], lines: Iterator[str]) -> Iterator[Any]:
+    for lineno, line in enumerate(lines, 1):
+        if not line or line.isspace():
+            continue
+        try:
+            yield parse(line)
+        except ValueError as exc:
+            msg = f"Invalid JSON on line {lineno}: {exc}"
+            raise ValueError(msg) from exc
+
+
+def _iter_lines(data: str) -> Iterator[str]:
+    # NOTE: JSON strings cannot contain raw line breaks, so splitting on `\n` is enough,
+    # unlike `str.splitlines` that also splits on e.g. `\u2028`.
+    start = 0
+    while (end := data.find("\n", start)) != -1:
+        yield data[start:end]
+        start = end + 1
+    yield data[start:]
+
+
+def _iter_file_lines(path: str | PathLike[str], encoding: str) -> Iterator[str]:
+    with Path(path).open(encoding=encoding) as f:
+        yield from f
+
+
+def _dumps(obj: Any, kwargs: dict[str, Any]) -> str:
+    # NOTE: `json.dumps` creates a new encoder for each call with non-default keyword
+    # arguments, so encoders are reused unless the arguments are unhashable. The key
+    # is not sorted because keyword arguments usually come in the same order, and it
+    # includes the argument types because equal values like `4` and `4.0` or `1` and
+    # `True` may behave differently.
+    if not kwargs:
+        return json.dumps(obj)
+    try:
+        encoder = _get_encoder(tuple((k, type(v), v) for k, v in kwargs.items()))
+    except TypeError:
+        return json.dumps(obj, **kwargs)
+    return encoder.encode(obj)
+
+
+@lru_cache(maxsize=64)
+def _get_encoder(kwargs: tuple[tuple[str, type, Any], ...]) -> json.JSONEncoder:
+    options: dict[str, Any] = {
+        "skipkeys": False,
+        "ensure_ascii": True,
+        "check_circular": True,
+        "allow_nan": True,
+        "indent": None,
+        "separators": None,
+        "default": None,
+        "sort_keys": False,
+        **{k: v for k, _, v in kwargs},
+    }
+    cls: type[json.JSONEncoder] = options.pop("cls", None) or json.JSONEncoder
+    return cls(**options)
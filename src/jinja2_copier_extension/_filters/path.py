@@ -2,9 +2,30 @@
 
 from __future__ import annotations
 
+import fnmatch
+import heapq
 import ntpath
+import os
 import os.path
-from pathlib import Path
+import re
+from functools import lru_cache
+from itertools import groupby
+from itertools import islice
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+from typing import TypeVar
+
+from jinja2 import pass_environment
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+
+    from jinja2 import Environment
+
+    from jinja2_copier_extension._utils import LRUCache
 
 __all__ = [
     "do_basename",
@@ -20,6 +41,14 @@ __all__ = [
     "do_win_splitdrive",
 ]
 
+_GLOB_MAGIC_PATTERN = re.compile(r"[*?[]")
+_ANY_NAME_PATTERN = re.compile("")
+_GLOB_SEPARATORS = tuple(sep for sep in (os.sep, os.altsep) if sep)
+_GLOB_SEPARATOR_PATTERN = re.compile("|".join(map(re.escape, _GLOB_SEPARATORS)))
+_T = TypeVar("_T")
+
+_IGNORE_PATTERN_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
 
 def do_basename(path: str) -> str:
     """Get the final component of a path.
@@ -45,65 +74,123 @@ def do_dirname(path: str) -> str:
     return os.path.dirname(path)  # noqa: PTH120
 
 
-def do_expanduser(path: str) -> str:
+@pass_environment
+def do_expanduser(environment: Environment, path: str) -> str:
     """Expand a path with the `~` and `~user` constructions.
 
     Args:
+        environment: A Jinja2 environment instance.
         path: A path.
 
     Returns:
         The expanded path.
     """
-    return os.path.expanduser(path)  # noqa: PTH111
+    return _cached(
+        environment,
+        ("expanduser", path),
+        lambda: os.path.expanduser(path),  # noqa: PTH111
+    )
 
 
-def do_expandvars(path: str) -> str:
+@pass_environment
+def do_expandvars(environment: Environment, path: str) -> str:
     """Expand a path with the shell variables of form `$var` and `${var}`.
 
     Args:
+        environment: A Jinja2 environment instance.
         path: A path.
 
     Returns:
         The expanded path.
     """
-    return os.path.expandvars(path)
+    return _cached(environment, ("expandvars", path), lambda: os.path.expandvars(path))
 
 
-def do_fileglob(pattern: str) -> list[str]:
+@pass_environment
+def do_fileglob(
+    environment: Environment,
+    pattern: str,
+    limit: int | None = None,
+    exclude: str | Sequence[str] | None = None,
+    ignore_file: str | None = None,
+) -> list[str]:
     """Get all files in a filesystem subtree according to a glob pattern.
 
+    The subtree is walked in sorted order, and `**` does not follow symbolic links to
+    directories. Files and directories matching an exclude pattern or a pattern of an
+    ignore file are skipped, and excluded directories are not walked at all. Exclude
+    patterns and ignore files use the `.gitignore` syntax, with exclude patterns
+    being relative to the current working directory. A pattern with a trailing
+    separator matches directories only, so no files.
+
     Args:
-        pattern: A glob pattern.
+        environment: A Jinja2 environment instance.
+        pattern: A glob pattern relative to the current working directory.
+        limit:
+            The maximum number of files to find, which are the first ones of the
+            sorted list. Defaults to no limit.
+        exclude: One or more patterns of files and directories to exclude.
+        ignore_file:
+            The name of ignore files (e.g. `".gitignore"`) whose patterns are applied
+            to the directory they are in and its subdirectories.
 
     Returns:
-        The list of files matching the glob pattern.
+        The sorted list of files matching the glob pattern.
     """
-    return [str(path) for path in Path().glob(pattern) if path.is_file()]
+    exclude = (exclude,) if isinstance(exclude, str) else tuple(exclude or ())
 
+    def fileglob() -> tuple[str, ...]:
+        parts = _parse_glob_pattern(pattern)
+        # NOTE: A trailing separator matches directories only.
+        if (limit is not None and limit <= 0) or pattern.endswith(_GLOB_SEPARATORS):
+            return ()
+        globber = _FileGlobber(parts, _parse_ignore_patterns("", exclude), ignore_file)
+        # NOTE: The files are walked in sorted order, so duplicates (e.g. `a/a/b` for
+        # `**/a/**/b`) are adjacent and the walk stops after the first `limit` files.
+        files = (file for file, _ in groupby(globber.walk("", 0)))
+        return tuple(islice(files, limit))
 
-def do_realpath(path: str) -> str:
+    key = ("fileglob", pattern, limit, exclude, ignore_file)
+    return list(_cached(environment, key, fileglob, relative=True))
+
+
+@pass_environment
+def do_realpath(environment: Environment, path: str) -> str:
     """Get the canonical form of a path.
 
     Args:
+        environment: A Jinja2 environment instance.
         path: A path.
 
     Returns:
         The canonical path.
     """
-    return os.path.realpath(path)
+    return _cached(
+        environment,
+        ("realpath", path),
+        lambda: os.path.realpath(path),
+        relative=True,
+    )
 
 
-def do_relpath(path: str, start: str) -> str:
+@pass_environment
+def do_relpath(environment: Environment, path: str, start: str) -> str:
     """Get the relative version of a path.
 
     Args:
+        environment: A Jinja2 environment instance.
         path: A path.
         start: A reference path.
 
     Returns:
         The path `path` relative to `start`.
     """
-    return os.path.relpath(path, start)
+    return _cached(
+        environment,
+        ("relpath", path, start),
+        lambda: os.path.relpath(path, start),
+        relative=True,
+    )
 
 
 def do_splitext(path: str) -> tuple[str, str]:
@@ -152,3 +239,294 @@ def do_win_splitdrive(path: str) -> tuple[str, str]:
         A tuple `(drive, path)`.
     """
     return ntpath.splitdrive(path)
+
+
+def _cached(
+    environment: Environment,
+    key: tuple[Any, ...],
+    compute: Callable[[], _T],
+    *,
+    relative: bool = False,
+) -> _T:
+    # NOTE: The path cache is disabled by default, so it is bypassed entirely without
+    # the overhead of recording a miss. Results that depend on the current working
+    # directory (`relative=True`) are cached per working directory.
+    cache: LRUCache[tuple[Any, ...], Any] | None = getattr(
+        environment,
+        "copier_path_cache",
+        None,
+    )
+    if cache is None or cache.maxsize <= 0:
+        return compute()
+    if relative:
+        key = (*key, os.getcwd())  # noqa: PTH109
+    if (value := cache.get(key)) is None:
+        value = compute()
+        cache.put(key, value)
+    return value
+
+
+class _FileGlobber:
+    """A file glob walker using `os.scandir`.
+
+    The `walk*` methods yield the matching files in sorted order.
+    """
+
+    def __init__(
+        self,
+        parts: tuple[re.Pattern[str] | str | None, ...],
+        exclude: tuple[_IgnoreRule, ...],
+        ignore_file: str | None,
+    ) -> None:
+        self.parts = parts
+        self._exclude = exclude
+        self._ignore_file = ignore_file
+        self._scandir_cache: dict[str, list[os.DirEntry[str]]] = {}
+        self._rules_cache: dict[str, tuple[_IgnoreRule, ...]] = {}
+
+    def walk(self, path: str, index: int) -> Iterator[str]:
+        part = self.parts[index]
+        if part is None:
+            return self._walk_recursive(path, index)
+        if isinstance(part, str):
+            return self._walk_literal(path, index, part)
+        return self._walk_wildcard(path, index, part)
+
+    def _walk_recursive(self, path: str, index: int) -> Iterator[str]:
+        rest = len(self.parts) - index - 1
+        if rest == 0:
+            return self._walk_subtree(path, index, _ANY_NAME_PATTERN)
+        if rest == 1 and isinstance(part := self.parts[index + 1], re.Pattern):
+            return self._walk_subtree(path, index, part)
+        # NOTE: The matches of the rest of the pattern in this directory interleave
+        # with those in its subdirectories, e.g. `b/c` sorts between `a/b/c` and
+        # `c/b/c` for `**/b/c`.
+        return heapq.merge(
+            self.walk(path, index + 1),
+            self._walk_subtree(path, index, None),
+        )
+
+    def _walk_subtree(
+        self,
+        path: str,
+        index: int,
+        files: re.Pattern[str] | None,
+    ) -> Iterator[str]:
+        # Yields the matches in the subdirectories and the files matching `files`.
+        for entry in self._scandir(path):
+            if entry.is_dir(follow_symlinks=False):
+                yield from self._walk_recursive(_join(path, entry.name), index)
+            elif (
+                files is not None
+                and files.match(os.path.normcase(entry.name))
+                and entry.is_file()
+            ):
+                yield _join(path, entry.name)
+
+    def _walk_literal(self, path: str, index: int, name: str) -> Iterator[str]:
+        child = _join(path, name)
+        is_dir = index < len(self.parts) - 1
+        if self._is_ignored(path, child, is_dir=is_dir):
+            return
+        if is_dir:
+            yield from self.walk(child, index + 1)
+        elif os.path.isfile(child):  # noqa: PTH113
+            yield child
+
+    def _walk_wildcard(
+        self,
+        path: str,
+        index: int,
+        pattern: re.Pattern[str],
+    ) -> Iterator[str]:
+        is_last = index == len(self.parts) - 1
+        for entry in self._scandir(path):
+            if not pattern.match(os.path.normcase(entry.name)):
+                continue
+            child = _join(path, entry.name)
+            if is_last:
+                if entry.is_file():
+                    yield child
+            elif entry.is_dir():
+                yield from self.walk(child, index + 1)
+
+    def _scandir(self, path: str) -> list[os.DirEntry[str]]:
+        if (entries := self._scandir_cache.get(path)) is None:
+            try:
+                with os.scandir(path or os.curdir) as it:
+                    entries = sorted(it, key=_sort_key)
+            except OSError:
+                entries = []
+            if self._exclude or self._ignore_file:
+                # NOTE: Reading the ignore file only if it is listed avoids a failing
+                # `open` call in each directory without one.
+                self._get_rules(
+                    path,
+                    has_ignore_file=any(
+                        entry.name == self._ignore_file for entry in entries
+                    ),
+                )
+                entries = [
+                    entry
+                    for entry in entries
+                    if not self._is_ignored(
+                        path,
+                        _join(path, entry.name),
+                        is_dir=entry.is_dir(),
+                    )
+                ]
+            self._scandir_cache[path] = entries
+        return entries
+
+    def _is_ignored(self, parent: str, path: str, *, is_dir: bool) -> bool:
+        if not self._exclude and not self._ignore_file:
+            return False
+        # NOTE: The last matching pattern wins, so negated patterns can re-include
+        # paths excluded by previous patterns.
+        for rule in reversed(self._get_rules(parent)):
+            if rule.dir_only and not is_dir:
+                continue
+            relpath = path[len(rule.base) + 1 :] if rule.base else path
+            if os.sep != "/":
+                relpath = relpath.replace(os.sep, "/")
+            if rule.pattern.fullmatch(relpath):
+                return not rule.negate
+        return False
+
+    def _get_rules(
+        self,
+        path: str,
+        *,
+        has_ignore_file: bool | None = None,
+    ) -> tuple[_IgnoreRule, ...]:
+        # Returns the ignore rules that apply to the entries of a directory.
+        if (rules := self._rules_cache.get(path)) is None:
+            rules = self._get_rules(os.path.dirname(path)) if path else self._exclude  # noqa: PTH120
+            if self._ignore_file and has_ignore_file is not False:
+                try:
+                    with open(_join(path, self._ignore_file), encoding="utf-8") as f:  # noqa: PTH123
+                        rules += _parse_ignore_patterns(path, tuple(f))
+                except OSError:
+                    pass
+            self._rules_cache[path] = rules
+        return rules
+
+
+@lru_cache(maxsize=128)
+def _parse_glob_pattern(pattern: str) -> tuple[re.Pattern[str] | str | None, ...]:
+    # Returns the pattern components: a compiled wildcard pattern, a literal name, or
+    # `None` for `**`.
+    if not pattern:
+        msg = f"Unacceptable pattern: {pattern!r}"
+        raise ValueError(msg)
+    if os.path.isabs(pattern) or os.path.splitdrive(pattern)[0]:  # noqa: PTH117
+        msg = "Non-relative patterns are unsupported"
+        raise NotImplementedError(msg)
+    parts: list[re.Pattern[str] | str | None] = []
+    for part in _GLOB_SEPARATOR_PATTERN.split(pattern):
+        if part in {"", os.curdir}:
+            continue
+        if part == "**":
+            if not parts or parts[-1] is not None:
+                parts.append(None)
+        elif _GLOB_MAGIC_PATTERN.search(part):
+            parts.append(re.compile(fnmatch.translate(os.path.normcase(part))))
+        else:
+            parts.append(part)
+    if not parts:
+        msg = f"Unacceptable pattern: {pattern!r}"
+        raise ValueError(msg)
+    return tuple(parts)
+
+
+class _IgnoreRule(NamedTuple):
+    base: str
+    pattern: re.Pattern[str]
+    negate: bool
+    dir_only: bool
+
+
+def _parse_ignore_patterns(
+    base: str,
+    lines: Sequence[str],
+) -> tuple[_IgnoreRule, ...]:
+    return tuple(
+        _IgnoreRule(base, *parsed)
+        for line in lines
+        if (parsed := _parse_ignore_pattern(line)) is not None
+    )
+
+
+@lru_cache(maxsize=1024)
+def _parse_ignore_pattern(line: str) -> tuple[re.Pattern[str], bool, bool] | None:
+    # Returns the compiled pattern and whether it is negated and matches directories
+    # only, or `None` for blank lines and comments.
+    pattern = line.rstrip("\r\n")
+    if not pattern or pattern.startswith("#"):
+        return None
+    # NOTE: Trailing spaces are ignored unless they are escaped with a backslash.
+    stripped = pattern.rstrip(" ")
+    if stripped.endswith("\\") and len(stripped) < len(pattern):
+        stripped += " "
+    pattern = stripped
+    negate = pattern.startswith("!")
+    if negate or pattern.startswith(("\\!", "\\#")):
+        pattern = pattern[1:]
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    if not pattern:
+        return None
+    # NOTE: A pattern with a separator in the beginning or middle is relative to its
+    # base directory, otherwise it matches at any level below it.
+    if "/" in pattern:
+        regex = _translate_ignore_pattern(pattern.lstrip("/"))
+    else:
+        regex = "(?:.*/)?" + _translate_ignore_pattern(pattern)
+    return re.compile(regex, _IGNORE_PATTERN_FLAGS), negate, dir_only
+
+
+def _translate_ignore_pattern(pattern: str) -> str:
+    parts: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        at_component_start = i == 0 or pattern[i - 1] == "/"
+        if at_component_start and pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+            continue
+        if at_component_start and i + 2 == n and pattern.startswith("**", i):
+            parts.append(".*")
+            break
+        char = pattern[i]
+        i += 1
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "\\" and i < n:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+        elif char == "[":
+            j = i + 1 if pattern[i : i + 1] in {"!", "^"} else i
+            j = pattern.find("]", j + 1 if pattern[j : j + 1] == "]" else j)
+            if j < 0:
+                parts.append(re.escape(char))
+                continue
+            chars = pattern[i:j].replace("\\", "\\\\")
+            if chars[:1] in {"!", "^"}:
+                chars = "^" + chars[1:]
+            parts.append(f"[{chars}]")
+            i = j + 1
+        else:
+            parts.append(re.escape(char))
+    return "".join(parts)
+
+
+def _sort_key(entry: os.DirEntry[str]) -> str:
+    # NOTE: Sorting a directory as its name with a trailing separator walks the files
+    # in the order of their sorted paths, e.g. `a-b` before `a/b`.
+    return entry.name + os.sep if entry.is_dir() else entry.name
+
+
+def _join(path: str, name: str) -> str:
+    return os.path.join(path, name) if path else name  # noqa: PTH118
@@ -3,24 +3,47 @@
 from __future__ import annotations
 
 import re
+import threading
+from functools import lru_cache
 from random import Random
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import TypeVar
 from typing import overload
 
+from jinja2 import pass_environment
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from jinja2 import Environment
+
+    from jinja2_copier_extension._utils import LRUCache
+
 
-__all__ = ["do_random", "do_random_mac", "do_shuffle"]
+__all__ = [
+    "do_random",
+    "do_random_mac",
+    "do_random_mac_pool",
+    "do_random_sample",
+    "do_shuffle",
+]
 
 _T = TypeVar("_T")
 
+_local = threading.local()
 
-def do_shuffle(seq: Sequence[_T], seed: str | None = None) -> list[_T]:
+
+@pass_environment
+def do_shuffle(
+    environment: Environment,
+    seq: Sequence[_T],
+    seed: str | None = None,
+) -> list[_T]:
     """Shuffle a sequence of elements.
 
     Args:
+        environment: A Jinja2 environment instance.
         seq: A sequence of elements.
         seed: A pseudo-random number generator seed.
 
@@ -28,12 +51,13 @@ def do_shuffle(seq: Sequence[_T], seed: str | None = None) -> list[_T]:
         The shuffled sequence of elements as a list.
     """
     seq = list(seq)
-    Random(seed).shuffle(seq)  # noqa: S311
+    _get_rng(environment, seed).shuffle(seq)
     return seq
 
 
 @overload
 def do_random(
+    environment: Environment,
     stop: int,
     start: int = 0,
     step: int = 1,
@@ -43,6 +67,7 @@ def do_random(
 
 @overload
 def do_random(
+    environment: Environment,
     stop: Sequence[_T],
     start: None = None,
     step: None = None,
@@ -50,7 +75,9 @@ def do_random(
 ) -> _T: ...
 
 
+@pass_environment
 def do_random(
+    environment: Environment,
     stop: int | Sequence[_T],
     start: int | None = None,
     step: int | None = None,
@@ -59,6 +86,7 @@ def do_random(
     """Generate a random integer in a range or choose a random element from a sequence.
 
     Args:
+        environment: A Jinja2 environment instance.
         stop: An exclusive upper bound.
         start: An inclusive lower bound.
         step: A step size.
@@ -70,29 +98,75 @@ def do_random(
     Raises:
         ValueError: If `stop` is a sequence and `start` or `step` are not `None`.
     """
-    rng = Random(seed)  # noqa: S311
-
     if isinstance(stop, int):
         if start is None:
             start = 0
         if step is None:
             step = 1
-        return rng.randrange(start, stop, step)
+        return _get_rng(environment, seed).randrange(start, stop, step)
 
     for arg_name, arg_value in [("start", start), ("step", step)]:
         if arg_value is not None:
             msg = f'"{arg_name}" can only be used when "stop" is an integer'
             raise ValueError(msg)
-    return rng.choice(stop)
+    return _get_rng(environment, seed).choice(stop)
+
+
+@pass_environment
+def do_random_sample(
+    environment: Environment,
+    population: int | Sequence[_T],
+    k: int,
+    *,
+    replace: bool = False,
+    seed: str | None = None,
+) -> list[int] | list[_T]:
+    """Choose random elements from a sequence or random integers from a range.
+
+    Args:
+        environment: A Jinja2 environment instance.
+        population:
+            A sequence of elements or an exclusive upper bound of a range of integers
+            starting at 0.
+        k: The number of elements to choose.
+        replace: Whether an element can be chosen more than once.
+        seed: A pseudo-random number generator seed.
+
+    Returns:
+        The chosen elements.
+
+    Raises:
+        ValueError: If `k` is negative, or larger than the population size without
+            replacement.
+    """
+    # NOTE: A range is sampled without creating a list of its elements.
+    elements: Sequence[Any] = (
+        range(population) if isinstance(population, int) else population
+    )
+    if k < 0:
+        msg = f'"k" must be non-negative, got {k}'
+        raise ValueError(msg)
+    rng = _get_rng(environment, seed)
+    if replace:
+        return rng.choices(elements, k=k)
+    return rng.sample(elements, k)
 
 
 MAC_LENGTH = 6
 
+_MAC_BYTE_PATTERN = re.compile(r"[a-f0-9]{2}")
+
 
-def do_random_mac(prefix: str, seed: str | None = None) -> str:
+@pass_environment
+def do_random_mac(
+    environment: Environment,
+    prefix: str,
+    seed: str | None = None,
+) -> str:
     """Generate a random MAC address given a prefix.
 
     Args:
+        environment: A Jinja2 environment instance.
         prefix: A MAC address prefix of max. 5 parts.
         seed: A pseudo-random number generator seed.
 
@@ -103,18 +177,101 @@ def do_random_mac(prefix: str, seed: str | None = None) -> str:
         ValueError: If `prefix` has more than 5 parts or any of the parts is not a
             hexadecimal bytes.
     """
-    parts = [] if prefix == "" else prefix.lower().strip(":").split(":")
+    parts = _parse_mac_prefix(prefix)
+    return _random_mac(_get_rng(environment, seed), parts)
+
+
+@pass_environment
+def do_random_mac_pool(
+    environment: Environment,
+    prefix: str,
+    n: int,
+    seed: str | None = None,
+) -> list[str]:
+    """Generate unique random MAC addresses given a prefix.
+
+    The first MAC address is the one generated by `random_mac` with the same prefix
+    and seed.
+
+    Args:
+        environment: A Jinja2 environment instance.
+        prefix: A MAC address prefix of max. 5 parts.
+        n: The number of MAC addresses to generate.
+        seed: A pseudo-random number generator seed.
+
+    Returns:
+        The random MAC addresses in the order they were generated.
+
+    Raises:
+        ValueError: If `prefix` has more than 5 parts or any of the parts is not a
+            hexadecimal bytes, or if `n` is negative or exceeds the number of MAC
+            addresses with the prefix.
+    """
+    parts = _parse_mac_prefix(prefix)
+    size = 256 ** (MAC_LENGTH - len(parts))
+    if not 0 <= n <= size:
+        msg = (
+            f'Invalid number of MAC addresses {n}: the prefix "{prefix}" allows '
+            f"between 0 and {size}"
+        )
+        raise ValueError(msg)
+    rng = _get_rng(environment, seed)
+    addresses: dict[str, None] = {}
+    while len(addresses) < n:
+        addresses[_random_mac(rng, parts)] = None
+    return list(addresses)
+
+
+@lru_cache(maxsize=128)
+def _parse_mac_prefix(prefix: str) -> tuple[str, ...]:
+    parts = () if prefix == "" else tuple(prefix.lower().strip(":").split(":"))
     if len(parts) >= MAC_LENGTH:
         msg = f'Invalid MAC address prefix "{prefix}": too many parts'
         raise ValueError(msg)
     for part in parts:
-        if not re.match(r"[a-f0-9]{2}", part):
+        if not _MAC_BYTE_PATTERN.fullmatch(part):
             msg = (
                 f'Invalid MAC address prefix "{prefix}": '
                 f'"{part}" is not a hexadecimal byte'
             )
             raise ValueError(msg)
-    rng = Random(seed)  # noqa: S311
+    return parts
+
+
+def _random_mac(rng: Random, parts: tuple[str, ...]) -> str:
+    # NOTE: `randrange(256)` draws the same values as `randint(0, 255)` with less
+    # overhead.
     return ":".join(
-        parts + [f"{rng.randint(0, 255):02x}" for _ in range(MAC_LENGTH - len(parts))],
+        (
+            *parts,
+            *(f"{rng.randrange(256):02x}" for _ in range(MAC_LENGTH - len(parts))),
+        ),
+    )
+
+
+def _get_rng(environment: Environment, seed: Any) -> Random:
+    # Returns a pseudo-random number generator in the state of `Random(seed)`.
+    if seed is None:
+        return Random()  # noqa: S311
+    # NOTE: Creating a `Random` instance seeds it from the OS entropy source first, so
+    # a generator is reused per thread and reset to the seeded state. The state after
+    # seeding is cached, as restoring it is cheaper than hashing a string seed again.
+    try:
+        rng: Random = _local.rng
+    except AttributeError:
+        rng = _local.rng = Random()  # noqa: S311
+    cache: LRUCache[tuple[type, Any], tuple[Any, ...]] | None = getattr(
+        environment,
+        "copier_random_state_cache",
+        None,
     )
+    if cache is None or cache.maxsize <= 0 or isinstance(seed, bytearray):
+        rng.seed(seed)
+        return rng
+    key = (type(seed), seed)
+    if (state := cache.get(key)) is not None:
+        rng.setstate(state)
+    else:
+        rng.seed(seed)
+        cache.put(key, rng.getstate())
+    return rng
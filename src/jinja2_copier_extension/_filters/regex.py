@@ -3,12 +3,23 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from typing import Literal
 
+from jinja2 import pass_environment
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from jinja2 import Environment
+
 __all__ = ["do_regex_escape", "do_regex_findall", "do_regex_replace", "do_regex_search"]
 
 
 _REGEX_ESCAPE_POSIX_BASIC_PATTERN = re.compile(r"([\[\]\.\^\$\*\\])")
+_BACKREF_NAME_PATTERN = re.compile(r"^\\g<(\S+)>$")
+_BACKREF_NUMBER_PATTERN = re.compile(r"^\\(\d+)$")
 
 
 def do_regex_escape(
@@ -31,90 +42,151 @@ def do_regex_escape(
     raise NotImplementedError(f"Unsupported regex type: {re_type}")  # noqa: EM102
 
 
+@pass_environment
 def do_regex_findall(
-    string: str,
+    environment: Environment,
+    string: str | list[str] | tuple[str, ...],
     # TODO(sisp): Rename argument to `pattern` for consistency with other filters.
-    regex: str,
+    regex: str | re.Pattern[str],
     # TODO(sisp): Require flags to be keyword-only arguments.
     multiline: bool = False,  # noqa: FBT001 FBT002
     ignorecase: bool = False,  # noqa: FBT001 FBT002
-) -> list[str] | list[tuple[str, ...]]:
+) -> list[str] | list[tuple[str, ...]] | list[list[str] | list[tuple[str, ...]]]:
     """Extract non-overlapping regex matches using `re.findall`.
 
     Args:
-        string: A string from which to extract matches.
-        regex: A regex pattern string.
+        environment: A Jinja2 environment instance.
+        string: A string from which to extract matches, or a list or tuple of strings.
+        regex: A regex pattern string or a compiled regex pattern.
         multiline: Whether to match the pattern for each line.
         ignorecase: Whether to perform case-insensitive matching.
 
     Returns:
-        A list of strings or string tuples containing the matches.
+        A list of strings or string tuples containing the matches. For a list or tuple
+        of strings, a list with one such list per string.
+
+    Raises:
+        ValueError: If flags are used with a compiled regex pattern.
     """
     flags = _get_flags(ignorecase=ignorecase, multiline=multiline)
-    return re.findall(regex, string, flags=flags)
+    findall = _compile(environment, regex, flags).findall
+    if isinstance(string, (list, tuple)):
+        return [findall(item) for item in string]
+    return findall(string)
 
 
-def do_regex_replace(
-    string: str,
-    pattern: str,
+@pass_environment
+def do_regex_replace(  # noqa: PLR0913, PLR0917
+    environment: Environment,
+    string: str | list[str] | tuple[str, ...],
+    pattern: str | re.Pattern[str],
     replacement: str,
     # TODO(sisp): Require flags to be keyword-only arguments.
     ignorecase: bool = False,  # noqa: FBT001 FBT002
     multiline: bool = False,  # noqa: FBT001 FBT002
-) -> str:
+) -> str | list[str]:
     """Substitute non-overlapping regex matches using `re.sub`.
 
     Args:
-        string: A string wherein to replace matching substrings.
-        pattern: A regex pattern string.
+        environment: A Jinja2 environment instance.
+        string: A string wherein to replace matching substrings, or a list or tuple
+            of strings.
+        pattern: A regex pattern string or a compiled regex pattern.
         replacement: A string to replace matching substrings with.
         ignorecase: Whether to perform case-insensitive matching.
         multiline: Whether to match the pattern for each line.
 
     Returns:
-        The string wherein matched substrings have been replaced.
+        The string wherein matched substrings have been replaced. For a list or tuple
+        of strings, a list with one such string per string.
+
+    Raises:
+        ValueError: If flags are used with a compiled regex pattern.
     """
     flags = _get_flags(ignorecase=ignorecase, multiline=multiline)
-    return re.sub(pattern, replacement, string, flags=flags)
+    sub = _compile(environment, pattern, flags).sub
+    if isinstance(string, (list, tuple)):
+        return [sub(replacement, item) for item in string]
+    return sub(replacement, string)
 
 
+@pass_environment
 def do_regex_search(
-    string: str,
-    pattern: str,
+    environment: Environment,
+    string: str | list[str] | tuple[str, ...],
+    pattern: str | re.Pattern[str],
     *args: str,
     ignorecase: bool = False,
     multiline: bool = False,
-) -> str | list[str] | None:
+) -> str | list[str] | list[str | list[str] | None] | None:
     r"""Search a string for a regex match using `re.search`.
 
     Args:
-        string: A string to search.
-        pattern: A regex pattern string.
+        environment: A Jinja2 environment instance.
+        string: A string to search, or a list or tuple of strings.
+        pattern: A regex pattern string or a compiled regex pattern.
         *args: An optional list of backreferences (`\\g<name>` or `\\number`) to return.
         ignorecase: Whether to perform case-insensitive matching.
         multiline: Whether to match the pattern for each line.
 
     Returns:
         A string (if the regex matches) or a list of strings (one for each backreference
-        match) or `None` (if there is no match).
+        match) or `None` (if there is no match). For a list or tuple of strings, a list
+        with one such result per string.
 
     Raises:
-        ValueError: If the backreference format is invalid.
+        ValueError: If the backreference format is invalid or flags are used with a
+            compiled regex pattern.
     """
+    groups = _parse_backrefs(args)
+    flags = _get_flags(ignorecase=ignorecase, multiline=multiline)
+    search = _compile(environment, pattern, flags).search
+    if isinstance(string, (list, tuple)):
+        return [_get_groups(search(item), groups) for item in string]
+    return _get_groups(search(string), groups)
+
+
+def _get_groups(
+    match: re.Match[str] | None,
+    groups: tuple[str | int, ...],
+) -> str | list[str] | None:
+    return match and (
+        list(result) if isinstance((result := match.group(*groups)), tuple) else result
+    )
+
+
+@lru_cache(maxsize=256)
+def _parse_backrefs(args: tuple[str, ...]) -> tuple[str | int, ...]:
     groups: list[str | int] = []
     for arg in args:
-        if match := re.match(r"^\\g<(\S+)>$", arg):
+        if match := _BACKREF_NAME_PATTERN.match(arg):
             groups.append(match.group(1))
-        elif match := re.match(r"^\\(\d+)$", arg):
+        elif match := _BACKREF_NUMBER_PATTERN.match(arg):
             groups.append(int(match.group(1)))
         else:
             msg = "Invalid backref format"
             raise ValueError(msg)
-
-    flags = _get_flags(ignorecase=ignorecase, multiline=multiline)
-    return (match := re.search(pattern, string, flags=flags)) and (
-        list(result) if isinstance((result := match.group(*groups)), tuple) else result
-    )
+    return tuple(groups)
+
+
+def _compile(
+    environment: Environment,
+    pattern: str | re.Pattern[str],
+    flags: int,
+) -> re.Pattern[str]:
+    if isinstance(pattern, str):
+        # NOTE: The cache is a `functools.lru_cache` around `re.compile`, whose lookups
+        # are cheaper than those of `LRUCache` and of the `re` module's own cache.
+        compile_: Callable[[str, int], re.Pattern[str]] = getattr(
+            environment,
+            "copier_regex_cache",
+            re.compile,
+        )
+        return compile_(pattern, flags)
+    if flags:
+        msg = "Flags cannot be used with a compiled regex pattern"
+        raise ValueError(msg)
+    return pattern
 
 
 def _get_flags(*, ignorecase: bool = False, multiline: bool = False) -> int:
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Mapping
 from contextlib import suppress
+from typing import TYPE_CHECKING
 from typing import Any
 
-__all__ = ["do_bool", "do_type_debug"]
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+__all__ = ["do_bool", "do_bool_each", "do_type_debug"]
 
 
 def do_bool(value: Any) -> bool:
@@ -25,6 +32,56 @@ def do_bool(value: Any) -> bool:
     Returns:
         The value parsed to boolean.
     """
+    return _BOOL_CONVERTERS.get(type(value), _to_bool)(value)
+
+
+def do_bool_each(
+    values: Iterable[Any] | Mapping[Any, Any],
+) -> list[bool] | dict[Any, bool]:
+    """Parse each item of a sequence or each value of a mapping to boolean.
+
+    Each item or value is parsed like the `bool` filter does.
+
+    Args:
+        values: A sequence of items or a mapping.
+
+    Returns:
+        The list of items parsed to boolean, or the mapping with its values parsed to
+        boolean.
+    """
+    if isinstance(values, Mapping):
+        return {
+            key: _BOOL_CONVERTERS.get(type(value), _to_bool)(value)
+            for key, value in values.items()
+        }
+    return [_BOOL_CONVERTERS.get(type(value), _to_bool)(value) for value in values]
+
+
+def do_type_debug(obj: object) -> str:
+    """Get the type name of an object.
+
+    Args:
+        obj: An object.
+
+    Returns:
+        The type name of the object.
+    """
+    return obj.__class__.__name__
+
+
+_BOOL_STRINGS = {
+    **dict.fromkeys(["y", "yes", "t", "true", "on"], True),
+    **dict.fromkeys(["n", "no", "f", "false", "off", "~", "null", "none"], False),
+}
+# NOTE: `float` only parses strings containing a (Unicode) decimal digit, or one of
+# these words with an optional sign and surrounding whitespace.
+_DIGIT_PATTERN = re.compile(r"\d")
+_FLOAT_WORDS = frozenset(
+    f"{sign}{word}" for sign in ["", "+", "-"] for word in ["inf", "infinity", "nan"]
+)
+
+
+def _to_bool(value: Any) -> bool:
     # Assume it's a number
     with suppress(TypeError, ValueError):
         return bool(float(value))
@@ -39,13 +96,25 @@ def do_bool(value: Any) -> bool:
     return bool(value)
 
 
-def do_type_debug(obj: object) -> str:
-    """Get the type name of an object.
+def _str_to_bool(value: str) -> bool:
+    # NOTE: This is equivalent to `_to_bool` for `str` values, but avoids raising and
+    # catching an exception for strings that are not numbers.
+    lower = value.lower()
+    if (result := _BOOL_STRINGS.get(lower)) is not None:
+        return result
+    if _DIGIT_PATTERN.search(value) or lower.strip() in _FLOAT_WORDS:
+        try:
+            return bool(float(value))
+        except ValueError:
+            pass
+    return bool(value)
 
-    Args:
-        obj: An object.
 
-    Returns:
-        The type name of the object.
-    """
-    return obj.__class__.__name__
+_BOOL_CONVERTERS: dict[type, Callable[[Any], bool]] = {
+    bool: bool,
+    # NOTE: Large integers raise `OverflowError` when cast to float like before.
+    int: lambda value: bool(float(value)),
+    float: bool,
+    str: _str_to_bool,
+    type(None): bool,
+}
@@ -2,23 +2,71 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from hashlib import sha1
 from uuid import NAMESPACE_DNS
+from uuid import UUID
 from uuid import uuid5
 
 __all__ = ["do_to_uuid"]
 
 _UUID_NAMESPACE = uuid5(NAMESPACE_DNS, "https://github.com/copier-org/copier")
+# NOTE: Longer names are not memoized to avoid keeping large strings alive.
+_MEMO_MAX_NAME_LENGTH = 1024
 
 
-def do_to_uuid(name: str) -> str:
+def do_to_uuid(
+    name: str | list[str] | tuple[str, ...],
+    namespace: str | UUID | None = None,
+) -> str | list[str]:
     """Generate a UUID v5 string from a name.
 
-    The UUID namespace is the DNS namespace `https://github.com/copier-org/copier`.
+    The UUID namespace defaults to the DNS namespace
+    `https://github.com/copier-org/copier`.
 
     Args:
-        name: A name.
+        name: A name, or a list or tuple of names to generate a UUID for each.
+        namespace:
+            A UUID namespace, or a name whose UUID v5 string in the DNS namespace is
+            used as the UUID namespace.
 
     Returns:
-        The UUID v5 string.
+        The UUID v5 string, or a list of UUID v5 strings for a list or tuple of names.
     """
-    return str(uuid5(_UUID_NAMESPACE, name))
+    namespace_bytes = (
+        _UUID_NAMESPACE.bytes
+        if namespace is None
+        else _resolve_namespace(namespace).bytes
+    )
+    if isinstance(name, (list, tuple)):
+        return [_to_uuid(namespace_bytes, item) for item in name]
+    return _to_uuid(namespace_bytes, name)
+
+
+@lru_cache(maxsize=128)
+def _resolve_namespace(namespace: str | UUID) -> UUID:
+    if isinstance(namespace, UUID):
+        return namespace
+    try:
+        return UUID(namespace)
+    except ValueError:
+        return uuid5(NAMESPACE_DNS, namespace)
+
+
+def _to_uuid(namespace: bytes, name: str) -> str:
+    if len(name) > _MEMO_MAX_NAME_LENGTH:
+        return _uuid5(namespace, name)
+    return _uuid5_cached(namespace, name)
+
+
+def _uuid5(namespace: bytes, name: str) -> str:
+    # NOTE: This is equivalent to `str(uuid5(UUID(bytes=namespace), name))` without
+    # creating `UUID` objects.
+    digest = bytearray(sha1(namespace + name.encode(), usedforsecurity=False).digest())
+    digest[6] = (digest[6] & 0x0F) | 0x50  # version 5
+    digest[8] = (digest[8] & 0x3F) | 0x80  # RFC 4122 variant
+    hex_ = digest[:16].hex()
+    return f"{hex_[:8]}-{hex_[8:12]}-{hex_[12:16]}-{hex_[16:20]}-{hex_[20:]}"
+
+
+_uuid5_cached = lru_cache(maxsize=4096)(_uuid5)
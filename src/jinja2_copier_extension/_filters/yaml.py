@@ -6,35 +6,70 @@ from typing import TYPE_CHECKING
 from typing import Any
 
 import yaml
+from jinja2 import pass_environment
+
+from jinja2_copier_extension._utils import parse_cached
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from jinja2 import Environment
+
 __all__ = ["do_from_yaml", "do_from_yaml_all", "do_to_nice_yaml", "do_to_yaml"]
 
+# NOTE: The backend only selects the loader. The libyaml emitter (`CDumper`) changes
+# the serialized output, e.g. it omits the document end marker after scalars and
+# escapes characters outside the Basic Multilingual Plane even with `allow_unicode`,
+# so the YAML filters always dump with the pure-Python `Dumper` like `yaml.dump`.
+_BACKENDS: dict[str, type[Any]] = {"python": yaml.SafeLoader}
+if hasattr(yaml, "CSafeLoader"):
+    _BACKENDS["libyaml"] = yaml.CSafeLoader
+
+
+def _get_loader(environment: Environment) -> type[Any]:
+    backend = getattr(environment, "copier_yaml_backend", "auto")
+    if backend == "auto":
+        return _BACKENDS.get("libyaml", _BACKENDS["python"])
+    try:
+        return _BACKENDS[backend]
+    except KeyError:
+        msg = f'YAML backend "{backend}" is not available'
+        raise ValueError(msg) from None
+
 
-def do_from_yaml(value: str) -> Any:
+@pass_environment
+def do_from_yaml(environment: Environment, value: str) -> Any:
     """Deserialize YAML data.
 
     Args:
+       environment: A Jinja2 environment instance.
        value: YAML data to deserialize.
 
     Returns:
        Deserialized YAML data.
     """
-    return yaml.load(value, Loader=yaml.SafeLoader)
+    loader = _get_loader(environment)
+    return parse_cached(
+        environment,
+        ("yaml", loader.__name__),
+        value,
+        lambda: yaml.load(value, Loader=loader),  # noqa: S506
+    )
 
 
-def do_from_yaml_all(value: str) -> Iterator[Any]:
+@pass_environment
+def do_from_yaml_all(environment: Environment, value: str) -> Iterator[Any]:
     """Deserialize multi-document YAML data.
 
     Args:
+       environment: A Jinja2 environment instance.
        value: YAML data to deserialize.
 
     Returns:
        Deserialized YAML data with one item per YAML document.
     """
-    return yaml.load_all(value, Loader=yaml.SafeLoader)
+    loader = _get_loader(environment)
+    return yaml.load_all(value, Loader=loader)
 
 
 def do_to_yaml(value: Any, /, **kwargs: Any) -> str:
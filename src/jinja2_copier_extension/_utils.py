@@ -2,19 +2,36 @@
 
 from __future__ import annotations
 
+import pickle
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Generic
+from typing import NamedTuple
+from typing import TypeVar
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Hashable
     from collections.abc import Sequence
 
+    from jinja2 import Environment
     from typing_extensions import TypeGuard
 
 
-__all__ = ["MISSING", "is_sequence"]
+__all__ = ["MISSING", "CacheInfo", "LRUCache", "is_sequence", "parse_cached"]
 
 MISSING = object()
 
+# NOTE: A pickled snapshot is never empty, so an empty one marks data seen once.
+_SEEN = b""
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+_T = TypeVar("_T")
+
 
 def is_sequence(obj: object) -> TypeGuard[Sequence[Any]]:
     """Checks whether an object is a sequence container.
@@ -26,3 +43,170 @@ def is_sequence(obj: object) -> TypeGuard[Sequence[Any]]:
         `True` if the object is sequence container, `False` otherwise.
     """
     return hasattr(obj, "__iter__") and not isinstance(obj, (str, bytes))
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[_K, _V]):
+    """A bounded least-recently-used cache with hit/miss statistics.
+
+    A maximum size of `0` disables the cache.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self._data: OrderedDict[_K, _V] = OrderedDict()
+        self._lock = Lock()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of cached entries."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        with self._lock:
+            self._maxsize = value
+            while len(self._data) > max(value, 0):
+                self._data.popitem(last=False)
+
+    def get(self, key: _K) -> _V | None:
+        """Get a cached value.
+
+        Args:
+            key: A cache key.
+
+        Returns:
+            The cached value or `None` if there is no value for the key.
+        """
+        # NOTE: Lookups do not take the lock, as it would cost more than the lookup
+        # itself. Each `OrderedDict` operation is atomic, and a value evicted by another
+        # thread between the lookup and the recency update is treated as a miss. The
+        # statistics may be off by a few counts under concurrent use.
+        data = self._data
+        try:
+            value = data[key]
+            data.move_to_end(key)
+        except KeyError:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return value
+
+    def peek(self, key: _K) -> _V | None:
+        """Get a cached value without counting a hit or miss.
+
+        Callers that decide themselves whether a lookup is a hit count it using
+        `record`.
+
+        Args:
+            key: A cache key.
+
+        Returns:
+            The cached value or `None` if there is no value for the key.
+        """
+        data = self._data
+        try:
+            value = data[key]
+            data.move_to_end(key)
+        except KeyError:
+            return None
+        return value
+
+    def record(self, *, hit: bool) -> None:
+        """Count a cache hit or miss.
+
+        Args:
+            hit: Whether to count a hit rather than a miss.
+        """
+        if hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+
+    def put(self, key: _K, value: _V) -> None:
+        """Cache a value, evicting the least recently used value if necessary.
+
+        Args:
+            key: A cache key.
+            value: The value to cache.
+        """
+        with self._lock:
+            if self._maxsize <= 0:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        """Get the cache statistics.
+
+        Returns:
+            The cache statistics.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = 0
+
+
+def parse_cached(
+    environment: Environment,
+    key: Hashable,
+    data: str | bytes,
+    parse: Callable[[], _T],
+) -> _T:
+    """Parse data using the environment's parse cache.
+
+    The first time some data is seen, only its digest is cached. When it is seen
+    again, a pickled snapshot of the parsed value is cached, and every later cache
+    hit returns a fresh copy of it, so mutating a result does not affect other
+    results. Data that is parsed only once thus does not pay for the snapshot.
+
+    Args:
+        environment: A Jinja2 environment instance.
+        key: A key identifying the parser and its settings.
+        data: The data to parse.
+        parse: A function parsing the data.
+
+    Returns:
+        The parsed data.
+    """
+    cache: LRUCache[Hashable, bytes] | None
+    cache = getattr(environment, "copier_parse_cache", None)
+    if cache is None or cache.maxsize <= 0 or not isinstance(data, (str, bytes)):
+        return parse()
+    raw = data.encode("utf-8", "surrogatepass") if isinstance(data, str) else data
+    cache_key = (key, blake2b(raw, digest_size=16).digest())
+    try:
+        snapshot = cache.peek(cache_key)
+    except TypeError:  # unhashable key
+        return parse()
+    # NOTE: Data seen once is still parsed, so finding its marker counts as a miss.
+    cache.record(hit=bool(snapshot))
+    if snapshot is None:
+        cache.put(cache_key, _SEEN)
+        return parse()
+    if snapshot is _SEEN:
+        result = parse()
+        try:
+            snapshot = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return result
+        cache.put(cache_key, snapshot)
+        return result
+    return pickle.loads(snapshot)  # type: ignore[no-any-return]  # noqa: S301
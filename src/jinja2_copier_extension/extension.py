@@ -2,54 +2,18 @@
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+from importlib import import_module
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
 from warnings import warn
 
+from jinja2 import pass_environment
 from jinja2.ext import Extension
 
-from ._filters.base64 import do_b64decode
-from ._filters.base64 import do_b64encode
-from ._filters.datetime import do_strftime
-from ._filters.datetime import do_to_datetime
-from ._filters.hash import do_hash
-from ._filters.hash import do_md5
-from ._filters.hash import do_sha1
-from ._filters.json import do_from_json
-from ._filters.json import do_to_json
-from ._filters.json import do_to_nice_json
-from ._filters.path import do_basename
-from ._filters.path import do_dirname
-from ._filters.path import do_expanduser
-from ._filters.path import do_expandvars
-from ._filters.path import do_fileglob
-from ._filters.path import do_realpath
-from ._filters.path import do_relpath
-from ._filters.path import do_splitext
-from ._filters.path import do_win_basename
-from ._filters.path import do_win_dirname
-from ._filters.path import do_win_splitdrive
-from ._filters.random import do_random
-from ._filters.random import do_random_mac
-from ._filters.random import do_shuffle
-from ._filters.regex import do_regex_escape
-from ._filters.regex import do_regex_findall
-from ._filters.regex import do_regex_replace
-from ._filters.regex import do_regex_search
-from ._filters.shell import do_quote
-from ._filters.types import do_bool
-from ._filters.types import do_type_debug
-from ._filters.utils import do_extract
-from ._filters.utils import do_flatten
-from ._filters.utils import do_groupby
-from ._filters.utils import do_mandatory
-from ._filters.utils import do_ternary
-from ._filters.uuid import do_to_uuid
-from ._filters.yaml import do_from_yaml
-from ._filters.yaml import do_from_yaml_all
-from ._filters.yaml import do_to_nice_yaml
-from ._filters.yaml import do_to_yaml
+from ._utils import LRUCache
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -57,50 +21,93 @@ if TYPE_CHECKING:
     from jinja2 import Environment
 
 
+def _lazy_filter(module: str, name: str) -> Callable[..., Any]:
+    """Create a filter that imports its implementation on first call.
+
+    Importing the filter modules eagerly would pull in their dependencies (e.g.
+    `yaml`) whenever the extension is loaded, even if no template uses them.
+
+    Args:
+        module: The name of the module in `_filters` implementing the filter.
+        name: The name of the filter function in the module.
+
+    Returns:
+        The lazily resolved filter.
+    """
+    resolved: tuple[Callable[..., Any], bool] | None = None
+
+    # NOTE: The filter functions are either plain functions or decorated with
+    # `pass_environment`, so the wrapper always receives the environment and passes
+    # it on only when needed.
+    @pass_environment
+    def lazy_filter(environment: Environment, /, *args: Any, **kwargs: Any) -> Any:
+        nonlocal resolved
+        if resolved is None:
+            func = getattr(import_module(f"._filters.{module}", __package__), name)
+            resolved = (func, hasattr(func, "jinja_pass_arg"))
+        func, pass_env = resolved
+        if pass_env:
+            return func(environment, *args, **kwargs)
+        return func(*args, **kwargs)
+
+    lazy_filter.__name__ = lazy_filter.__qualname__ = name
+    return lazy_filter
+
+
 # NOTE: mypy disallows `Callable[[Any, ...], Any]`
 _filters: Mapping[str, Callable[..., Any]] = {
-    "ans_groupby": do_groupby,
-    "ans_random": do_random,
-    "b64decode": do_b64decode,
-    "b64encode": do_b64encode,
-    "basename": do_basename,
-    "bool": do_bool,
-    "checksum": do_sha1,
-    "dirname": do_dirname,
-    "expanduser": do_expanduser,
-    "expandvars": do_expandvars,
-    "extract": do_extract,
-    "fileglob": do_fileglob,
-    "flatten": do_flatten,
-    "from_json": do_from_json,
-    "from_yaml": do_from_yaml,
-    "from_yaml_all": do_from_yaml_all,
-    "hash": do_hash,
-    "mandatory": do_mandatory,
-    "md5": do_md5,
-    "quote": do_quote,
-    "random_mac": do_random_mac,
-    "realpath": do_realpath,
-    "regex_escape": do_regex_escape,
-    "regex_findall": do_regex_findall,
-    "regex_replace": do_regex_replace,
-    "regex_search": do_regex_search,
-    "relpath": do_relpath,
-    "sha1": do_sha1,
-    "shuffle": do_shuffle,
-    "splitext": do_splitext,
-    "strftime": do_strftime,
-    "ternary": do_ternary,
-    "to_datetime": do_to_datetime,
-    "to_json": do_to_json,
-    "to_nice_json": do_to_nice_json,
-    "to_nice_yaml": do_to_nice_yaml,
-    "to_uuid": do_to_uuid,
-    "to_yaml": do_to_yaml,
-    "type_debug": do_type_debug,
-    "win_basename": do_win_basename,
-    "win_dirname": do_win_dirname,
-    "win_splitdrive": do_win_splitdrive,
+    "ans_groupby": _lazy_filter("utils", "do_groupby"),
+    "ans_random": _lazy_filter("random", "do_random"),
+    "b64decode": _lazy_filter("base64", "do_b64decode"),
+    "b64encode": _lazy_filter("base64", "do_b64encode"),
+    "basename": _lazy_filter("path", "do_basename"),
+    "bool": _lazy_filter("types", "do_bool"),
+    "bool_each": _lazy_filter("types", "do_bool_each"),
+    "checksum": _lazy_filter("hash", "do_sha1"),
+    "digest": _lazy_filter("hash", "do_digest"),
+    "dirname": _lazy_filter("path", "do_dirname"),
+    "expanduser": _lazy_filter("path", "do_expanduser"),
+    "expandvars": _lazy_filter("path", "do_expandvars"),
+    "extract": _lazy_filter("utils", "do_extract"),
+    "fileglob": _lazy_filter("path", "do_fileglob"),
+    "flatten": _lazy_filter("utils", "do_flatten"),
+    "from_json": _lazy_filter("json", "do_from_json"),
+    "from_jsonl": _lazy_filter("json", "do_from_jsonl"),
+    "from_yaml": _lazy_filter("yaml", "do_from_yaml"),
+    "from_yaml_all": _lazy_filter("yaml", "do_from_yaml_all"),
+    "hash": _lazy_filter("hash", "do_hash"),
+    "hash_chunks": _lazy_filter("hash", "do_hash_chunks"),
+    "hash_each": _lazy_filter("hash", "do_hash_each"),
+    "hash_file": _lazy_filter("hash", "do_hash_file"),
+    "mandatory": _lazy_filter("utils", "do_mandatory"),
+    "md5": _lazy_filter("hash", "do_md5"),
+    "md5_file": _lazy_filter("hash", "do_md5_file"),
+    "quote": _lazy_filter("shell", "do_quote"),
+    "random_mac": _lazy_filter("random", "do_random_mac"),
+    "random_mac_pool": _lazy_filter("random", "do_random_mac_pool"),
+    "random_sample": _lazy_filter("random", "do_random_sample"),
+    "realpath": _lazy_filter("path", "do_realpath"),
+    "regex_escape": _lazy_filter("regex", "do_regex_escape"),
+    "regex_findall": _lazy_filter("regex", "do_regex_findall"),
+    "regex_replace": _lazy_filter("regex", "do_regex_replace"),
+    "regex_search": _lazy_filter("regex", "do_regex_search"),
+    "relpath": _lazy_filter("path", "do_relpath"),
+    "sha1": _lazy_filter("hash", "do_sha1"),
+    "sha1_file": _lazy_filter("hash", "do_sha1_file"),
+    "shuffle": _lazy_filter("random", "do_shuffle"),
+    "splitext": _lazy_filter("path", "do_splitext"),
+    "strftime": _lazy_filter("datetime", "do_strftime"),
+    "ternary": _lazy_filter("utils", "do_ternary"),
+    "to_datetime": _lazy_filter("datetime", "do_to_datetime"),
+    "to_json": _lazy_filter("json", "do_to_json"),
+    "to_nice_json": _lazy_filter("json", "do_to_nice_json"),
+    "to_nice_yaml": _lazy_filter("yaml", "do_to_nice_yaml"),
+    "to_uuid": _lazy_filter("uuid", "do_to_uuid"),
+    "to_yaml": _lazy_filter("yaml", "do_to_yaml"),
+    "type_debug": _lazy_filter("types", "do_type_debug"),
+    "win_basename": _lazy_filter("path", "do_win_basename"),
+    "win_dirname": _lazy_filter("path", "do_win_dirname"),
+    "win_splitdrive": _lazy_filter("path", "do_win_splitdrive"),
 }
 
 
@@ -109,6 +116,17 @@ class CopierExtension(Extension):
 
     def __init__(self, environment: Environment) -> None:
         super().__init__(environment)
+        environment.extend(
+            copier_file_hash_cache=LRUCache(maxsize=1024),
+            copier_json_backend="auto",
+            copier_parse_cache=LRUCache(maxsize=128),
+            copier_path_cache=LRUCache(maxsize=0),
+            copier_random_state_cache=LRUCache(maxsize=128),
+            copier_regex_cache=lru_cache(maxsize=1024)(re.compile),
+            copier_render_clock=False,
+            copier_render_time=None,
+            copier_yaml_backend="auto",
+        )
         for k, v in _filters.items():
             if k in environment.filters:
                 warn(
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import platform
+import warnings
 from datetime import datetime
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
 import pytest
+from jinja2 import DictLoader
 from time_machine import travel
 
 from tests.utils import render
@@ -34,6 +36,44 @@ def test_strftime(env: Environment, filter_call: str, expected: str) -> None:
     assert render(env, f"[[ '%H:%M:%S' | {filter_call} ]]") == expected
 
 
+@pytest.mark.skipif(
+    condition=platform.system() not in {"Linux", "Darwin"},
+    reason="time zone mocking via `time.tzset()` only works on Unix",
+)
+def test_strftime_render_clock(env: Environment) -> None:
+    """Test that the render clock freezes the current time until it is reset."""
+    env.copier_render_clock = True  # type: ignore[attr-defined]
+    env.loader = DictLoader({"time": "[[ '%H:%M:%S' | strftime ]]"})
+    template = (
+        "[[ '%H:%M:%S' | strftime ]]|[[ shift(5) or '' ]]"
+        "[[ '%H:%M:%S' | strftime ]]|{% include 'time' %}"
+    )
+    start = datetime(1970, 1, 1, 2, 3, 4, tzinfo=ZoneInfo("America/Los_Angeles"))
+    with travel(start, tick=False) as traveller:
+        result = render(env, template, shift=traveller.shift)
+        assert result == "02:03:04|02:03:04|02:03:04"
+        result = render(env, template, shift=traveller.shift)
+        assert result == "02:03:04|02:03:04|02:03:04"
+        assert render(env, "[[ '%H:%M:%S' | strftime(12345) ]]") == "19:25:45"
+        env.copier_render_time = None  # type: ignore[attr-defined]
+        assert render(env, "[[ '%H:%M:%S' | strftime ]]") == "02:03:14"
+        env.copier_render_clock = False  # type: ignore[attr-defined]
+        traveller.shift(5)
+        assert render(env, "[[ '%H:%M:%S' | strftime ]]") == "02:03:19"
+
+
+@pytest.mark.skipif(
+    condition=platform.system() not in {"Linux", "Darwin"},
+    reason="time zone mocking via `time.tzset()` only works on Unix",
+)
+def test_strftime_render_clock_call_filter(env: Environment) -> None:
+    """Test calling `strftime` with the render clock outside a template."""
+    env.copier_render_clock = True  # type: ignore[attr-defined]
+    env.copier_render_time = 12345  # type: ignore[attr-defined]
+    with travel(datetime(1970, 1, 1, tzinfo=ZoneInfo("UTC"))):
+        assert env.call_filter("strftime", "%H:%M:%S") == "03:25:45"
+
+
 def test_to_datetime(env: Environment) -> None:
     """Test converting a string with date/time inforation to a `datetime` object."""
     result = render(
@@ -43,3 +83,81 @@ def test_to_datetime(env: Environment) -> None:
         date2="2016-08-12",
     )
     assert result == "2"
+
+
+@pytest.mark.parametrize(
+    ("string", "format_"),
+    [
+        ("2016-08-14 20:00:12", "%Y-%m-%d %H:%M:%S"),
+        ("2016-8-4 2:0:1", "%Y-%m-%d %H:%M:%S"),
+        ("2016-08-14T20:00:12.5", "%Y-%m-%dT%H:%M:%S.%f"),
+        ("14/08/16", "%d/%m/%y"),
+        ("[2016] 8 %", "[%Y] %m %%"),
+        ("2016-08-14 t 20", "%Y-%m-%d T %H"),
+        ("Aug 14 2016", "%b %d %Y"),
+    ],
+)
+def test_to_datetime_format(env: Environment, string: str, format_: str) -> None:
+    """Test converting a string with date/time information in various formats."""
+    result = render(env, "[[ (v | to_datetime(f)).isoformat() ]]", v=string, f=format_)
+    assert result == datetime.strptime(string, format_).isoformat()  # noqa: DTZ007
+
+
+@pytest.mark.parametrize(
+    ("string", "format_"),
+    [("08-14", "%m-%d"), ("14 20:00", "%d %H:%M")],
+)
+def test_to_datetime_format_without_year(
+    env: Environment,
+    string: str,
+    format_: str,
+) -> None:
+    """Test that a day without a year is parsed and warned about like `strptime`."""
+    with warnings.catch_warnings(record=True) as expected_warnings:
+        warnings.simplefilter("always")
+        expected = datetime.strptime(string, format_)  # noqa: DTZ007
+    template = "[[ (v | to_datetime(f)).isoformat() ]]"
+    with warnings.catch_warnings(record=True) as result_warnings:
+        warnings.simplefilter("always")
+        result = render(env, template, v=string, f=format_)
+    assert result == expected.isoformat()
+    assert [w.category for w in result_warnings] == [
+        w.category for w in expected_warnings
+    ]
+
+
+@pytest.mark.parametrize(
+    ("string", "format_", "error"),
+    [
+        ("2016-13-14 20:00:12", "%Y-%m-%d %H:%M:%S", "does not match format"),
+        ("2016-02-30", "%Y-%m-%d", "day is out of range for month"),
+        ("2016-08-14 20:00:61", "%Y-%m-%d %H:%M:%S", "second must be in 0..59"),
+        ("2016-08-14 20:00", "%Y-%m-%d", "unconverted data remains"),
+    ],
+)
+def test_to_datetime_invalid(
+    env: Environment,
+    string: str,
+    format_: str,
+    error: str,
+) -> None:
+    """Test converting an invalid string with date/time information."""
+    with pytest.raises(ValueError, match=error):
+        render(env, "[[ v | to_datetime(f) ]]", v=string, f=format_)
+
+
+def test_to_datetime_sequence(env: Environment) -> None:
+    """Test converting a sequence of strings with date/time information."""
+    result = render(
+        env,
+        "[[ v | to_datetime('%Y-%m-%d') | map(attribute='day') | join('|') ]]",
+        v=["2016-08-12", "2016-08-14"],
+    )
+    assert result == "12|14"
+
+
+@pytest.mark.parametrize("value", ["missing", "42"])
+def test_to_datetime_non_string(env: Environment, value: str) -> None:
+    """Test converting a value that is not a string or list."""
+    with pytest.raises(TypeError, match="strptime\\(\\) argument 1 must be str"):
+        render(env, f"[[ {value} | to_datetime ]]")
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import tracemalloc
 from typing import TYPE_CHECKING
 
 import pytest
 
+from jinja2_copier_extension._utils import CacheInfo
 from tests.utils import render
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from jinja2 import Environment
 
 
@@ -44,6 +50,128 @@ def test_hash_with_md5_algorithm(env: Environment, filter_call: str) -> None:
     assert result == "ad0234829205b9033196ba818f7a872b"
 
 
+@pytest.mark.parametrize(
+    "value",
+    [b"test2", bytearray(b"test2"), memoryview(b"xtest2x")[1:-1]],
+)
+@pytest.mark.parametrize("filter_call", ["hash", "hash('sha1')", "sha1"])
+def test_hash_with_bytes_like(
+    env: Environment,
+    value: object,
+    filter_call: str,
+) -> None:
+    """Test hashing bytes-like data."""
+    result = render(env, f"[[ v | {filter_call} ]]", v=value)
+    assert result == "109f4b3c50d7b0df729d299bc6f8e9ef9066971f"
+
+
+def test_hash_with_algorithm_not_guaranteed(env: Environment) -> None:
+    """Test hashing with an algorithm that has no named constructor."""
+    result = render(env, "[[ v | hash('SHA256') ]]", v="test2")
+    assert result == "60303ae22b998861bce3b28f33eec1be758a213c86c93c076dbe9f558c11c752"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        "test2",
+        [1, 2.5, True, None],
+        {"b": [1, {"d": "ü", "c": None}], "a": (1, 2)},
+        {2: "x", 1.5: list(range(300)), True: None},
+        {"items": [{"id": i, "tags": ["a", "b"], "x": {"y": i}} for i in range(1000)]},
+        [[[list(range(300))]]],
+    ],
+)
+def test_digest(env: Environment, value: object) -> None:
+    """Test hashing structured data in a canonical form."""
+    expected = render(env, "[[ v | to_json(sort_keys=True) | hash ]]", v=value)
+    assert render(env, "[[ v | digest ]]", v=value) == expected
+
+
+def test_digest_with_algorithm(env: Environment) -> None:
+    """Test hashing structured data with a custom algorithm."""
+    value = {"a": list(range(1000))}
+    expected = render(env, "[[ v | to_json(sort_keys=True) | hash('md5') ]]", v=value)
+    assert render(env, "[[ v | digest('md5') ]]", v=value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        list(range(50_000)),
+        {f"key{i}": i for i in range(30_000)},
+    ],
+)
+def test_digest_bounded_memory(env: Environment, value: object) -> None:
+    """Test hashing large flat structured data with bounded temporary memory."""
+    tracemalloc.start()
+    try:
+        render(env, "[[ v | digest ]]", v=value)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 1024 * 1024
+
+
+def test_digest_circular_reference(env: Environment) -> None:
+    """Test hashing structured data with a circular reference."""
+    value: list[object] = list(range(1000))
+    value.append(value)
+    with pytest.raises(ValueError, match="Circular reference detected"):
+        render(env, "[[ v | digest ]]", v=value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        ["te", b"s", bytearray(b"t"), memoryview(b"2")],
+        (chunk for chunk in ["t", "est", "2"]),
+        "test2",
+        b"test2",
+    ],
+)
+def test_hash_chunks(env: Environment, value: object) -> None:
+    """Test hashing a sequence of data chunks as a whole."""
+    result = render(env, "[[ v | hash_chunks ]]", v=value)
+    assert result == "109f4b3c50d7b0df729d299bc6f8e9ef9066971f"
+
+
+def test_hash_chunks_with_algorithm(env: Environment) -> None:
+    """Test hashing a sequence of data chunks with a custom algorithm."""
+    result = render(env, "[[ v | hash_chunks('md5') ]]", v=["test", "2"])
+    assert result == "ad0234829205b9033196ba818f7a872b"
+
+
+def test_hash_each(env: Environment) -> None:
+    """Test hashing each item of a sequence of small and large data."""
+    value: list[str | bytes] = ["test2", b"x" * 100_000, "", "y" * 100_000, b"test2"]
+    expected = [
+        hashlib.sha256(item.encode() if isinstance(item, str) else item).hexdigest()
+        for item in value
+    ]
+    result = render(env, "[[ v | hash_each('sha256') | join('|') ]]", v=value)
+    assert result == "|".join(expected)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["test2", b"test2", bytearray(b"test2"), memoryview(b"test2")],
+)
+def test_hash_each_single_item(env: Environment, value: object) -> None:
+    """Test hashing each item of a single string or bytes-like object."""
+    result = render(env, "[[ v | hash_each | join('|') ]]", v=value)
+    assert result == "109f4b3c50d7b0df729d299bc6f8e9ef9066971f"
+
+
+def test_hash_each_memoryview(env: Environment) -> None:
+    """Test hashing each item of a sequence of multi-byte memoryviews."""
+    value = [memoryview(bytes([i]) * 100_000).cast("Q") for i in range(3)]
+    expected = [hashlib.sha256(item).hexdigest() for item in value]
+    result = render(env, "[[ v | hash_each('sha256') | join('|') ]]", v=value)
+    assert result == "|".join(expected)
+
+
 def test_sha1(env: Environment) -> None:
     """Test the `sha1` filter."""
     result = render(env, "[[ v | sha1 ]]", v="test2")
@@ -60,3 +188,51 @@ def test_checksum(env: Environment) -> None:
     """Test the `checksum` filter."""
     result = render(env, "[[ v | checksum ]]", v="test2")
     assert result == "109f4b3c50d7b0df729d299bc6f8e9ef9066971f"
+
+
+@pytest.mark.parametrize(
+    ("filter_call", "expected"),
+    [
+        ("hash_file", "109f4b3c50d7b0df729d299bc6f8e9ef9066971f"),
+        ("hash_file('md5')", "ad0234829205b9033196ba818f7a872b"),
+        ("md5_file", "ad0234829205b9033196ba818f7a872b"),
+        ("sha1_file", "109f4b3c50d7b0df729d299bc6f8e9ef9066971f"),
+    ],
+)
+def test_hash_file(
+    env: Environment,
+    tmp_path: Path,
+    filter_call: str,
+    expected: str,
+) -> None:
+    """Test hashing the contents of a file."""
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"test2")
+    assert render(env, f"[[ v | {filter_call} ]]", v=str(path)) == expected
+
+
+def test_hash_file_larger_than_chunk(env: Environment, tmp_path: Path) -> None:
+    """Test hashing a file that is read in several chunks."""
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"x" * (3 * 1024 * 1024 + 1))
+    result = render(env, "[[ v | hash_file('sha256') ]]", v=str(path))
+    assert result == "d7e5697503e2fe5e59e91384af0f8566f4269f6fb21d6d31a66d61196fe4f0ae"
+
+
+def test_hash_file_cache(env: Environment, tmp_path: Path) -> None:
+    """Test that file hashes are cached until the file changes."""
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"test2")
+    for _ in range(2):
+        result = render(env, "[[ v | hash_file ]]", v=str(path))
+        assert result == "109f4b3c50d7b0df729d299bc6f8e9ef9066971f"
+    path.write_bytes(b"test3")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+    result = render(env, "[[ v | hash_file ]]", v=str(path))
+    assert result == "3ebfa301dc59196f18593c45e519287a23297589"
+    assert env.copier_file_hash_cache.cache_info() == CacheInfo(  # type: ignore[attr-defined]
+        hits=1,
+        misses=2,
+        maxsize=1024,
+        currsize=2,
+    )
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
+from typing import Any
 
+import pytest
+
+from jinja2_copier_extension._utils import CacheInfo
 from tests.utils import render
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from jinja2 import Environment
 
 
@@ -15,6 +22,37 @@ def test_from_json(env: Environment) -> None:
     assert render(env, "[[ v | from_json ]]", v='"München"') == "München"
 
 
+def test_from_jsonl(env: Environment) -> None:
+    """Test the `from_jsonl` filter with a string."""
+    data = '{"a": 1}\r\n\n  \n["\u2028"]\n"M\\u00fcnchen"'
+    template = "{% for r in v | from_jsonl %}[[ r ]];{% endfor %}"
+    assert render(env, template, v=data) == "{'a': 1};['\\u2028'];München;"
+
+
+def test_from_jsonl_path(env: Environment, tmp_path: Path) -> None:
+    """Test the `from_jsonl` filter with a file path."""
+    path = tmp_path / "data.jsonl"
+    path.write_text('{"a": 1}\n\n[1.5]\n', encoding="utf-8")
+    expected = "[{'a': 1}, [1.5]]"
+    result = render(env, "[[ v | from_jsonl(path=True) | list ]]", v=str(path))
+    assert result == expected
+    assert render(env, "[[ v | from_jsonl | list ]]", v=path) == expected
+    result = render(env, "[[ v | from_jsonl(parse_float=f) | list ]]", v=path, f=str)
+    assert result == "[{'a': 1}, ['1.5']]"
+
+
+def test_from_jsonl_is_lazy(env: Environment) -> None:
+    """Test that `from_jsonl` only parses the lines that are consumed."""
+    template = "[[ v | from_jsonl | first ]]"
+    assert render(env, template, v="[1]\ninvalid") == "[1]"
+
+
+def test_from_jsonl_invalid(env: Environment) -> None:
+    """Test the `from_jsonl` filter with invalid JSON."""
+    with pytest.raises(ValueError, match=r"^Invalid JSON on line 3: Expecting value"):
+        render(env, "[[ v | from_jsonl | list ]]", v="[1]\n\n]")
+
+
 def test_to_json(env: Environment) -> None:
     """Test the `to_json` filter with default settings."""
     assert render(env, "[[ v | to_json ]]", v="München") == r'"M\u00fcnchen"'
@@ -36,3 +74,132 @@ def test_to_nice_json_with_custom_indent(env: Environment) -> None:
     """Test the `to_nice_json` filter with custom indentation setting."""
     result = render(env, "[[ v | to_nice_json(indent=2) ]]", v={"x": [1, 2], "k": "v"})
     assert result == '{\n  "k": "v",\n  "x": [\n    1,\n    2\n  ]\n}'
+
+
+_TO_JSON_PARITY_KWARGS: list[dict[str, Any]] = [
+    {},
+    {"sort_keys": True},
+    {"indent": 2, "ensure_ascii": False},
+    {"separators": (",", ":")},
+    {"separators": [",", ":"]},
+    {"default": str},
+]
+
+
+@pytest.mark.parametrize("kwargs", _TO_JSON_PARITY_KWARGS)
+def test_to_json_parity(env: Environment, kwargs: dict[str, Any]) -> None:
+    """Test that `to_json` matches `json.dumps` with the same keyword arguments."""
+    data = {"b": [1, 2.5, None], "a": {"ü": True}, "c": {1, 2}}
+    if "default" not in kwargs:
+        data.pop("c")
+    result = render(env, "[[ v | to_json(**kwargs) ]]", v=data, kwargs=kwargs)
+    assert result == json.dumps(data, **kwargs)
+
+
+def test_to_json_with_equal_arguments_of_other_type(env: Environment) -> None:
+    """Test that `to_json` does not reuse an encoder for arguments of another type."""
+    data = {"a": [1]}
+    for indent in [4, 1, True]:
+        result = render(env, "[[ v | to_json(indent=i) ]]", v=data, i=indent)
+        assert result == json.dumps(data, indent=indent)
+    with pytest.raises(TypeError, match="can't multiply sequence by non-int"):
+        render(env, "[[ v | to_json(indent=i) ]]", v=data, i=4.0)
+
+
+def test_to_json_with_custom_encoder(env: Environment) -> None:
+    """Test the `to_json` filter with a custom encoder class."""
+
+    class SetEncoder(json.JSONEncoder):
+        def default(self, o: Any) -> Any:
+            return sorted(o) if isinstance(o, set) else super().default(o)
+
+    for _ in range(2):
+        result = render(env, "[[ v | to_json(cls=cls) ]]", v={2, 1}, cls=SetEncoder)
+        assert result == "[1, 2]"
+    with pytest.raises(TypeError, match="not JSON serializable"):
+        render(env, "[[ v | to_json ]]", v={2, 1})
+
+
+def test_from_json_cache(env: Environment) -> None:
+    """Test that `from_json` caches parsed data without sharing mutable state."""
+    env.copier_json_backend = "python"  # type: ignore[attr-defined]
+    template = "{%- set r = v | from_json -%}{%- set _ = r.k.append(3) -%}[[ r ]]"
+    for _ in range(3):
+        assert render(env, template, v='{"k": [1, 2]}') == "{'k': [1, 2, 3]}"
+    assert render(env, "[[ v | from_json(parse_int=f) ]]", v="[1]", f=float) == "[1.0]"
+    assert render(env, "[[ v | from_json ]]", v="[1]") == "[1]"
+    assert env.copier_parse_cache.cache_info() == CacheInfo(  # type: ignore[attr-defined]
+        hits=1,
+        misses=4,
+        maxsize=128,
+        currsize=3,
+    )
+
+
+def test_from_json_cache_disabled(env: Environment) -> None:
+    """Test `from_json` with the parse cache disabled."""
+    env.copier_parse_cache.maxsize = 0  # type: ignore[attr-defined]
+    for _ in range(2):
+        assert render(env, "[[ v | from_json ]]", v='{"k": 1}') == "{'k': 1}"
+    assert env.copier_parse_cache.cache_info() == CacheInfo(  # type: ignore[attr-defined]
+        hits=0,
+        misses=0,
+        maxsize=0,
+        currsize=0,
+    )
+
+
+_JSON_BACKEND_PARITY_DATA = [
+    '{"a": [1, 2.5, -0.0, 1e300, null], "b": {"c": true, "d": "M\\u00fcnchen"}}',
+    '"\\ud83d\\ude00 \\ud800"',
+    '{"a": 1, "a": 2}',
+    "[NaN, Infinity, -Infinity]",
+    "123456789012345678901234567890",
+    "[18446744073709551616, -9223372036854775809, 9223372036854775807]",
+    '{"id": 12345678901234567890123, "name": "x"}',
+    "\ufeff[]",
+    '{"a": }',
+    "[1, 2",
+]
+
+
+@pytest.mark.parametrize("data", _JSON_BACKEND_PARITY_DATA)
+def test_json_backend_parity(env: Environment, data: str) -> None:
+    """Test that the orjson and stdlib backends produce the same result or error."""
+    pytest.importorskip("orjson")
+    env.copier_parse_cache.maxsize = 0  # type: ignore[attr-defined]
+    results = []
+    for backend in ["python", "orjson"]:
+        env.copier_json_backend = backend  # type: ignore[attr-defined]
+        try:
+            results.append(render(env, "[[ v | from_json | pprint ]]", v=data))
+        except ValueError as exc:
+            results.append(f"{type(exc).__name__}: {exc}")
+    assert results[0] == results[1]
+
+
+def test_json_backend_parse_cache(env: Environment) -> None:
+    """Test that `from_json` only uses the parse cache for the stdlib JSON backend."""
+    pytest.importorskip("orjson")
+    for backend in ["python", "python", "orjson", "python"]:
+        env.copier_json_backend = backend  # type: ignore[attr-defined]
+        assert render(env, "[[ v | from_json ]]", v="[1]") == "[1]"
+    assert env.copier_parse_cache.cache_info() == CacheInfo(  # type: ignore[attr-defined]
+        hits=1,
+        misses=2,
+        maxsize=128,
+        currsize=1,
+    )
+
+
+def test_json_backend_python(env: Environment) -> None:
+    """Test forcing the stdlib JSON backend."""
+    env.copier_json_backend = "python"  # type: ignore[attr-defined]
+    assert render(env, "[[ v | from_json ]]", v="[NaN]") == "[nan]"
+
+
+def test_json_backend_unavailable(env: Environment) -> None:
+    """Test using an unavailable JSON backend."""
+    env.copier_json_backend = "unknown"  # type: ignore[attr-defined]
+    with pytest.raises(ValueError, match='JSON backend "unknown" is not available'):
+        render(env, "[[ v | from_json ]]", v="{}")
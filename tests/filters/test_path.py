@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 import pytest
 from pychoir import MatchesRegex
 
+from jinja2_copier_extension._utils import CacheInfo
 from tests.utils import build_file_tree
 from tests.utils import cd
 from tests.utils import render
@@ -67,6 +68,196 @@ def test_fileglob(env: Environment, tmp_path: Path) -> None:
         assert result == f"{Path('a.txt')}|{Path('c', 'd.txt')}"
 
 
+def test_fileglob_sorted(env: Environment, tmp_path: Path) -> None:
+    """Test getting files according to a glob pattern in sorted order."""
+    build_file_tree(
+        {
+            tmp_path / "b" / "c.txt": "",
+            tmp_path / "a.txt": "",
+            tmp_path / ".d" / "e.txt": "",
+            tmp_path / "b" / "a" / "f.txt": "",
+        },
+    )
+    with cd(tmp_path):
+        result = render(env, "[[ v | fileglob | join('|') ]]", v="**/*.txt")
+    expected = sorted(
+        [
+            str(Path(".d", "e.txt")),
+            "a.txt",
+            str(Path("b", "a", "f.txt")),
+            str(Path("b", "c.txt")),
+        ],
+    )
+    assert result == "|".join(expected)
+
+
+def test_fileglob_limit(env: Environment, tmp_path: Path) -> None:
+    """Test getting a limited number of files according to a glob pattern."""
+    build_file_tree({tmp_path / "a" / f"{i}.txt": "" for i in range(10)})
+    with cd(tmp_path):
+        result = render(env, "[[ v | fileglob(limit=3) | join('|') ]]", v="a/*.txt")
+    assert result == "|".join(str(Path("a", f"{i}.txt")) for i in range(3))
+
+
+@pytest.mark.parametrize("pattern", ["**/*.txt", "**/b/*.txt", "**/b/**/*.txt", "*/*"])
+def test_fileglob_limit_sorted(env: Environment, tmp_path: Path, pattern: str) -> None:
+    """Test that a limited glob finds the first files of the sorted list."""
+    build_file_tree(
+        {
+            tmp_path / "z.txt": "",
+            tmp_path / "b" / "a.txt": "",
+            tmp_path / "b" / "b" / "c.txt": "",
+            tmp_path / "a" / "b" / "d.txt": "",
+            tmp_path / "a-b" / "e.txt": "",
+            tmp_path / "a" / "b" / "b" / "f.txt": "",
+        },
+    )
+    with cd(tmp_path):
+        result = render(env, "[[ v | fileglob | join('|') ]]", v=pattern)
+        files = result.split("|")
+        assert files == sorted(set(files))
+        for limit in range(len(files) + 1):
+            result = render(env, "[[ v | fileglob(limit=n) ]]", v=pattern, n=limit)
+            assert result == str(files[:limit])
+
+
+@pytest.mark.parametrize("pattern", ["**/", "*/", "a/", "a/b.txt/"])
+def test_fileglob_trailing_separator(
+    env: Environment,
+    tmp_path: Path,
+    pattern: str,
+) -> None:
+    """Test that a glob pattern with a trailing separator finds no files."""
+    build_file_tree({tmp_path / "a" / "b.txt": "", tmp_path / "c.txt": ""})
+    with cd(tmp_path):
+        assert render(env, "[[ v | fileglob ]]", v=pattern) == "[]"
+
+
+@pytest.mark.skipif(
+    condition=platform.system() == "Windows",
+    reason="symbolic links require privileges on Windows",
+)
+def test_fileglob_symlink(env: Environment, tmp_path: Path) -> None:
+    """Test that a recursive glob pattern does not follow symbolic links."""
+    build_file_tree({tmp_path / "a" / "b.txt": ""})
+    (tmp_path / "c").symlink_to(tmp_path / "a", target_is_directory=True)
+    with cd(tmp_path):
+        result = render(env, "[[ v | fileglob | join('|') ]]", v="**/*.txt")
+        assert result == str(Path("a", "b.txt"))
+        result = render(env, "[[ v | fileglob | join('|') ]]", v="*/*.txt")
+        assert result == f"{Path('a', 'b.txt')}|{Path('c', 'b.txt')}"
+
+
+@pytest.mark.parametrize(
+    ("exclude", "expected"),
+    [
+        ("node_modules", ["a.txt", "b/c.txt", "b/d/e.txt"]),
+        (["node_modules", "d/"], ["a.txt", "b/c.txt"]),
+        (["/b/d", "node_modules/**"], ["a.txt", "b/c.txt"]),
+        (["*.txt", "!c.txt"], ["b/c.txt"]),
+        (["b/*.txt"], ["a.txt", "b/d/e.txt", "node_modules/f.txt"]),
+    ],
+)
+def test_fileglob_exclude(
+    env: Environment,
+    tmp_path: Path,
+    exclude: str | list[str],
+    expected: list[str],
+) -> None:
+    """Test getting files according to a glob pattern with exclude patterns."""
+    build_file_tree(
+        {
+            tmp_path / "a.txt": "",
+            tmp_path / "b" / "c.txt": "",
+            tmp_path / "b" / "d" / "e.txt": "",
+            tmp_path / "node_modules" / "f.txt": "",
+        },
+    )
+    with cd(tmp_path):
+        result = render(
+            env,
+            "[[ v | fileglob(exclude=exclude) | join('|') ]]",
+            v="**/*.txt",
+            exclude=exclude,
+        )
+    assert result == "|".join(str(Path(path)) for path in expected)
+
+
+def test_fileglob_ignore_file(env: Environment, tmp_path: Path) -> None:
+    """Test getting files according to a glob pattern with ignore files."""
+    build_file_tree(
+        {
+            tmp_path / ".gitignore": """\
+                # Dependencies
+                node_modules/
+                *.log
+                !keep.log
+                """,
+            tmp_path / "a.txt": "",
+            tmp_path / "a.log": "",
+            tmp_path / "b" / ".gitignore": "/c\n",
+            tmp_path / "b" / "c" / "d.txt": "",
+            tmp_path / "b" / "e" / "c" / "f.txt": "",
+            tmp_path / "b" / "keep.log": "",
+            tmp_path / "node_modules" / "g.txt": "",
+        },
+    )
+    with cd(tmp_path):
+        result = render(
+            env,
+            "[[ v | fileglob(ignore_file='.gitignore') | join('|') ]]",
+            v="**/*.*",
+        )
+    expected = [
+        ".gitignore",
+        "a.txt",
+        str(Path("b", ".gitignore")),
+        str(Path("b", "e", "c", "f.txt")),
+        str(Path("b", "keep.log")),
+    ]
+    assert result == "|".join(expected)
+
+
+def test_fileglob_absolute_pattern(env: Environment, tmp_path: Path) -> None:
+    """Test that an absolute glob pattern is unsupported."""
+    with pytest.raises(NotImplementedError, match="Non-relative patterns"):
+        render(env, "[[ v | fileglob ]]", v=str(tmp_path / "*.txt"))
+
+
+def test_path_cache(env: Environment, tmp_path: Path) -> None:
+    """Test that path filter results are cached per working directory if enabled."""
+    tmp_path = tmp_path.resolve()
+    env.copier_path_cache.maxsize = 16  # type: ignore[attr-defined]
+    build_file_tree({tmp_path / "a" / "b.txt": "", tmp_path / "c" / "d.txt": ""})
+    template = "[[ '*.txt' | fileglob | join('|') ]],[[ '.' | realpath ]]"
+    with cd(tmp_path / "a"):
+        assert render(env, template) == f"b.txt,{tmp_path / 'a'}"
+        build_file_tree({tmp_path / "a" / "e.txt": ""})
+        assert render(env, template) == f"b.txt,{tmp_path / 'a'}"
+    with cd(tmp_path / "c"):
+        assert render(env, template) == f"d.txt,{tmp_path / 'c'}"
+    assert env.copier_path_cache.cache_info() == CacheInfo(  # type: ignore[attr-defined]
+        hits=2,
+        misses=4,
+        maxsize=16,
+        currsize=4,
+    )
+    env.copier_path_cache.cache_clear()  # type: ignore[attr-defined]
+    with cd(tmp_path / "a"):
+        assert render(env, template) == f"b.txt|e.txt,{tmp_path / 'a'}"
+
+
+def test_path_cache_disabled(env: Environment) -> None:
+    """Test that path filter results are not cached by default."""
+    assert render(env, "[[ v | expandvars ]]", v="$NONEXISTENT") == "$NONEXISTENT"
+    assert env.copier_path_cache.cache_info() == CacheInfo(  # type: ignore[attr-defined]
+        hits=0,
+        misses=0,
+        maxsize=0,
+        currsize=0,
+    )
+
+
 def test_realpath(env: Environment, tmp_path: Path) -> None:
     """Test getting the canonical form of a path."""
     build_file_tree(
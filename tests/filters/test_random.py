@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import re
+from random import Random
 from typing import TYPE_CHECKING
 
 import pytest
 
+from jinja2_copier_extension._utils import CacheInfo
 from tests.utils import render
 
 if TYPE_CHECKING:
@@ -18,6 +20,36 @@ def test_shuffle(env: Environment) -> None:
     assert render(env, "[[ v | shuffle(seed='123') ]]", v=[1, 2, 3]) == "[2, 1, 3]"
 
 
+@pytest.mark.parametrize("maxsize", [128, 0])
+@pytest.mark.parametrize("seed", ["123", 123, 1.5, b"123"])
+def test_random_state_cache(
+    env: Environment,
+    maxsize: int,
+    seed: str | float | bytes,
+) -> None:
+    """Test that cached seeded states produce the same values as fresh generators."""
+    env.copier_random_state_cache.maxsize = maxsize  # type: ignore[attr-defined]
+    seq = list(range(20))
+    expected_seq = seq.copy()
+    Random(seed).shuffle(expected_seq)  # noqa: S311
+    expected = (
+        f"{expected_seq}|{Random(seed).randrange(0, 1000, 1)}|"  # noqa: S311
+        f"{Random(seed).choice(seq)}"  # noqa: S311
+    )
+    template = (
+        "[[ seq | shuffle(seed=seed) ]]|[[ 1000 | ans_random(seed=seed) ]]|"
+        "[[ seq | ans_random(seed=seed) ]]"
+    )
+    for _ in range(3):
+        assert render(env, template, seq=seq, seed=seed) == expected
+    assert env.copier_random_state_cache.cache_info() == CacheInfo(  # type: ignore[attr-defined]
+        hits=8 if maxsize else 0,
+        misses=1 if maxsize else 0,
+        maxsize=maxsize,
+        currsize=1 if maxsize else 0,
+    )
+
+
 @pytest.mark.parametrize(
     ("filter_call", "expected"),
     [
@@ -55,6 +87,41 @@ def test_random_choice_with_incompatible_args(
         render(env, f"[[ v | {filter_call} ]]", v=[1, 2, 3])
 
 
+@pytest.mark.parametrize(
+    ("population", "filter_args", "expected"),
+    [
+        (10, "3, seed='123'", Random("123").sample(range(10), 3)),  # noqa: S311
+        (10**18, "2, seed='123'", Random("123").sample(range(10**18), 2)),  # noqa: S311
+        (["a", "b", "c"], "3, seed='123'", Random("123").sample("abc", 3)),  # noqa: S311
+        (3, "5, replace=True, seed='123'", Random("123").choices(range(3), k=5)),  # noqa: S311
+        (["a", "b"], "3, replace=True, seed='123'", ["b", "a", "a"]),
+        ([], "0", []),
+    ],
+)
+def test_random_sample(
+    env: Environment,
+    population: int | list[str],
+    filter_args: str,
+    expected: list[object],
+) -> None:
+    """Test choosing random elements from a sequence or integers from a range."""
+    result = render(env, f"[[ v | random_sample({filter_args}) ]]", v=population)
+    assert result == f"{expected}"
+
+
+def test_random_sample_positional_replace(env: Environment) -> None:
+    """Test that `replace` and `seed` of `random_sample` are keyword-only."""
+    with pytest.raises(TypeError, match="positional argument"):
+        render(env, "[[ v | random_sample(2, True, '123') ]]", v=[1, 2, 3])
+
+
+@pytest.mark.parametrize("k", [-1, 4])
+def test_random_sample_invalid_k(env: Environment, k: int) -> None:
+    """Test choosing an invalid number of random elements without replacement."""
+    with pytest.raises(ValueError, match=r"(negative|larger than population)"):
+        render(env, "[[ v | random_sample(k) ]]", v=[1, 2, 3], k=k)
+
+
 @pytest.mark.parametrize(
     ("prefix", "expected"),
     [
@@ -79,6 +146,10 @@ def test_random_mac(env: Environment, prefix: str, expected: str) -> None:
             "52:54:xy",
             'Invalid MAC address prefix "52:54:xy": "xy" is not a hexadecimal byte',
         ),
+        (
+            "52:54:aaa",
+            'Invalid MAC address prefix "52:54:aaa": "aaa" is not a hexadecimal byte',
+        ),
         (
             "52:54:00:25:a4:fc",
             'Invalid MAC address prefix "52:54:00:25:a4:fc": too many parts',
@@ -93,3 +164,39 @@ def test_random_mac_with_invalid_prefix(
     """Test generating a random MAC address given an invalid prefix."""
     with pytest.raises(ValueError, match=re.escape(error)):
         render(env, "[[ v | random_mac(seed='123') ]]", v=prefix)
+
+
+def test_random_mac_pool(env: Environment) -> None:
+    """Test generating unique random MAC addresses given a prefix."""
+    result = render(
+        env,
+        "[[ v | random_mac_pool(100, seed='123') | join('|') ]]",
+        v="52:54:00",
+    )
+    addresses = result.split("|")
+    assert len(set(addresses)) == len(addresses) == 100  # noqa: PLR2004
+    assert all(re.fullmatch(r"52:54:00(:[a-f0-9]{2}){3}", a) for a in addresses)
+    assert addresses[0] == render(env, "[[ v | random_mac(seed='123') ]]", v="52:54:00")
+
+
+def test_random_mac_pool_exhausts_prefix(env: Environment) -> None:
+    """Test generating all MAC addresses with a prefix."""
+    result = render(
+        env,
+        "[[ v | random_mac_pool(256) | sort | join('|') ]]",
+        v="52:54:00:25:a4",
+    )
+    assert result == "|".join(f"52:54:00:25:a4:{i:02x}" for i in range(256))
+
+
+@pytest.mark.parametrize("n", [-1, 257])
+def test_random_mac_pool_with_invalid_n(env: Environment, n: int) -> None:
+    """Test generating an invalid number of MAC addresses given a prefix."""
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            f'Invalid number of MAC addresses {n}: the prefix "52:54:00:25:a4" '
+            "allows between 0 and 256",
+        ),
+    ):
+        render(env, "[[ v | random_mac_pool(n) ]]", v="52:54:00:25:a4", n=n)
@@ -8,6 +8,7 @@ from typing import Literal
 
 import pytest
 
+from jinja2_copier_extension._utils import CacheInfo
 from tests.utils import render
 
 if TYPE_CHECKING:
@@ -80,7 +81,92 @@ def test_regex_search(
     assert render(env, f"[[ v | {filter_call} ]]", v=value) == expected
 
 
+@pytest.mark.parametrize(
+    ("filter_call", "expected"),
+    [
+        ("regex_findall('[a-z]+')", "[['foo', 'bar'], [], ['copier']]"),
+        (r"regex_replace('^(.*)ier$', '\\1y')", "['foo bar', '123', 'copy']"),
+        ("regex_search('[a-z]+')", "['foo', None, 'copier']"),
+        (
+            r"regex_search('([a-z]+)', '\\1', '\\0')",
+            "[['foo', 'foo'], None, ['copier', 'copier']]",
+        ),
+    ],
+)
+def test_regex_with_list(env: Environment, filter_call: str, expected: str) -> None:
+    """Test applying the regex filters to a list of strings."""
+    result = render(env, f"[[ v | {filter_call} ]]", v=["foo bar", "123", "copier"])
+    assert result == expected
+    assert env.copier_regex_cache.cache_info().misses == 1  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize(
+    "filter_call",
+    ["regex_findall('a')", "regex_replace('a', 'b')", "regex_search('a')"],
+)
+@pytest.mark.parametrize("value", ["missing", "42"])
+def test_regex_with_non_string(env: Environment, value: str, filter_call: str) -> None:
+    """Test applying the regex filters to a value that is not a string or list."""
+    with pytest.raises(TypeError, match="expected string or bytes-like object"):
+        render(env, f"[[ {value} | {filter_call} ]]")
+
+
 def test_regex_search_with_invalid_backref_format(env: Environment) -> None:
     """Test searching a string for a regex match with an invalid backref format."""
     with pytest.raises(ValueError, match=re.escape("Invalid backref format")):
         render(env, "[[ 'foo/bar' | regex_search('([a-z]+)', 'invalid-backref') ]]")
+
+
+def test_regex_cache(env: Environment) -> None:
+    """Test that compiled regex patterns are cached by pattern and flags."""
+    for _ in range(2):
+        assert render(env, "[[ 'Foo' | regex_search('[a-z]+') ]]") == "oo"
+        result = render(env, "[[ 'Foo' | regex_search('[a-z]+', ignorecase=True) ]]")
+        assert result == "Foo"
+    assert render(env, "[[ 'Foo' | regex_replace('[a-z]+', '') ]]") == "F"
+    assert render(env, "[[ 'Foo' | regex_findall('[a-z]+') ]]") == "['oo']"
+    assert env.copier_regex_cache.cache_info() == CacheInfo(  # type: ignore[attr-defined]
+        hits=4,
+        misses=2,
+        maxsize=1024,
+        currsize=2,
+    )
+
+
+@pytest.mark.parametrize(
+    ("filter_call", "expected"),
+    [
+        ("regex_findall(p)", "['oo']"),
+        ("regex_replace(p, '')", "F"),
+        ("regex_search(p)", "oo"),
+    ],
+)
+def test_regex_with_compiled_pattern(
+    env: Environment,
+    filter_call: str,
+    expected: str,
+) -> None:
+    """Test the regex filters with a compiled regex pattern."""
+    result = render(env, f"[[ 'Foo' | {filter_call} ]]", p=re.compile("[a-z]+"))
+    assert result == expected
+    assert env.copier_regex_cache.cache_info().currsize == 0  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize(
+    "filter_call",
+    [
+        "regex_findall(p, ignorecase=True)",
+        "regex_replace(p, '', multiline=True)",
+        "regex_search(p, ignorecase=True)",
+    ],
+)
+def test_regex_with_compiled_pattern_and_flags(
+    env: Environment,
+    filter_call: str,
+) -> None:
+    """Test the regex filters with a compiled regex pattern and flags."""
+    with pytest.raises(
+        ValueError,
+        match="Flags cannot be used with a compiled regex pattern",
+    ):
+        render(env, f"[[ 'Foo' | {filter_call} ]]", p=re.compile("[a-z]+"))
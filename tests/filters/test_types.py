@@ -59,6 +59,17 @@ if TYPE_CHECKING:
         ("none", False),
         ("NONE", False),
         ("nOnE", False),
+        ("0", False),
+        ("-0.0", False),
+        (" 1_000 ", True),
+        ("\u0663", True),
+        ("nan", True),
+        ("-Infinity", True),
+        ("", False),
+        ("maybe", True),
+        (" yes ", True),
+        ([], False),
+        ([0], True),
     ],
 )
 def test_bool(env: Environment, value: Any, expected: bool) -> None:
@@ -67,6 +78,18 @@ def test_bool(env: Environment, value: Any, expected: bool) -> None:
     assert render(env, "[[ v | bool ]]", v=value) == str(expected)
 
 
+def test_bool_each(env: Environment) -> None:
+    """Test parsing each item of a sequence to boolean."""
+    result = render(env, "[[ v | bool_each ]]", v=["yes", "0", 1.5, None, "maybe"])
+    assert result == "[True, False, True, False, True]"
+
+
+def test_bool_each_mapping(env: Environment) -> None:
+    """Test parsing each value of a mapping to boolean."""
+    result = render(env, "[[ v | bool_each ]]", v={"a": "off", "b": "2"})
+    assert result == "{'a': False, 'b': True}"
+
+
 @pytest.mark.parametrize(("obj", "expected"), [("foo", "str"), (123, "int")])
 def test_type_debug(env: Environment, obj: object, expected: str) -> None:
     """Test getting the type name of an object."""
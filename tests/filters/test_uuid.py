@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from uuid import NAMESPACE_DNS
+from uuid import NAMESPACE_URL
+from uuid import uuid5
+
+import pytest
+from jinja2 import UndefinedError
 
 from tests.utils import render
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from jinja2 import Environment
 
 
@@ -14,3 +22,38 @@ def test_to_uuid(env: Environment) -> None:
     """Test generating a UUID from a name."""
     result = render(env, "[[ 'foo' | to_uuid ]]")
     assert result == "faf9357a-ee2a-58ed-94fd-cc8661984561"
+
+
+@pytest.mark.parametrize(
+    ("namespace", "expected"),
+    [
+        (
+            "6ba7b811-9dad-11d1-80b4-00c04fd430c8",
+            "7da78284-2f14-5e7f-95e1-baaa9027c26f",
+        ),
+        ("example.com", "38ede018-f5f7-507b-b1e7-1f20a8a15545"),
+        (NAMESPACE_URL, "7da78284-2f14-5e7f-95e1-baaa9027c26f"),
+    ],
+)
+def test_to_uuid_with_namespace(
+    env: Environment,
+    namespace: str | UUID,
+    expected: str,
+) -> None:
+    """Test generating a UUID from a name in a custom namespace."""
+    result = render(env, "[[ 'foo' | to_uuid(namespace) ]]", namespace=namespace)
+    assert result == expected
+
+
+def test_to_uuid_sequence(env: Environment) -> None:
+    """Test generating UUIDs from a sequence of names."""
+    names = ["foo", "bar", "foo", "ü" * 2000]
+    result = render(env, "[[ v | to_uuid | join('|') ]]", v=names)
+    namespace = uuid5(NAMESPACE_DNS, "https://github.com/copier-org/copier")
+    assert result == "|".join(str(uuid5(namespace, name)) for name in names)
+
+
+def test_to_uuid_undefined(env: Environment) -> None:
+    """Test generating a UUID from an undefined variable."""
+    with pytest.raises(UndefinedError, match="'missing' is undefined"):
+        render(env, "[[ missing | to_uuid ]]")
@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from typing import Any
 
+import pytest
+import yaml
+
+from jinja2_copier_extension._utils import CacheInfo
 from tests.utils import render
 
 if TYPE_CHECKING:
@@ -24,6 +29,19 @@ def test_from_yaml(env: Environment) -> None:
     assert result == "True|{'k': True}"
 
 
+def test_from_yaml_cache(env: Environment) -> None:
+    """Test that `from_yaml` caches parsed data without sharing mutable state."""
+    template = "{%- set r = v | from_yaml -%}{%- set _ = r.k.append(3) -%}[[ r ]]"
+    for _ in range(3):
+        assert render(env, template, v="k: [1, 2]") == "{'k': [1, 2, 3]}"
+    assert env.copier_parse_cache.cache_info() == CacheInfo(  # type: ignore[attr-defined]
+        hits=1,
+        misses=2,
+        maxsize=128,
+        currsize=1,
+    )
+
+
 def test_from_yaml_all(env: Environment) -> None:
     """Test the `from_yaml_all` filter with default settings."""
     result = render(
@@ -44,6 +62,18 @@ def test_to_yaml(env: Environment) -> None:
     assert render(env, "[[ v | to_yaml ]]", v={"k": True}) == "k: true\n"
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("foo", "foo\n...\n"),
+        ({"emoji": "😀"}, "emoji: 😀\n"),
+    ],
+)
+def test_to_yaml_output(env: Environment, value: Any, expected: str) -> None:
+    """Test that the `to_yaml` output does not depend on the YAML backend."""
+    assert render(env, "[[ v | to_yaml ]]", v=value) == expected
+
+
 def test_to_nice_yaml(env: Environment) -> None:
     """Test the `to_nice_yaml` filter with default settings."""
     result = render(env, "[[ v | to_nice_yaml ]]", v={"x": {"y": [1, 2]}, "k": "v"})
@@ -58,3 +88,39 @@ def test_to_nice_yaml_with_custom_indent(env: Environment) -> None:
         v={"x": {"y": [1, 2]}, "k": "v"},
     )
     assert result == "k: v\nx:\n  y:\n  - 1\n  - 2\n"
+
+
+@pytest.mark.skipif(
+    condition=not yaml.__with_libyaml__,
+    reason="PyYAML is not built with libyaml",
+)
+@pytest.mark.parametrize(
+    ("filter_call", "value"),
+    [
+        ("from_yaml", "a: [1, 2.5, null]\nb:\n  c: true\n  d: München\n"),
+        ("from_yaml_all | list", "a: 1\n---\nb: 2001-02-03\n"),
+        ("to_yaml", {"a": [1, 2.5, None], "b": {"c": True, "d": "München"}}),
+        ("to_nice_yaml", {"a": [1, 2.5, None], "b": {"c": True, "d": "München"}}),
+        ("to_nice_yaml(indent=2)", {"x": {"y": [1, 2]}, "k": (3, 4)}),
+        ("from_yaml", "foo\n...\n"),
+        ("from_yaml", "emoji: 😀\n"),
+        ("to_yaml", "foo"),
+        ("to_yaml", 42),
+        ("to_yaml", {"emoji": "😀"}),
+        ("to_nice_yaml", ["😀", "München"]),
+    ],
+)
+def test_yaml_backend_parity(env: Environment, filter_call: str, value: Any) -> None:
+    """Test that the libyaml and pure-Python backends produce the same output."""
+    env.copier_yaml_backend = "python"  # type: ignore[attr-defined]
+    expected = render(env, f"[[ v | {filter_call} ]]", v=value)
+    env.copier_yaml_backend = "libyaml"  # type: ignore[attr-defined]
+    assert render(env, f"[[ v | {filter_call} ]]", v=value) == expected
+
+
+@pytest.mark.parametrize("filter_call", ["from_yaml", "from_yaml_all | list"])
+def test_yaml_backend_unavailable(env: Environment, filter_call: str) -> None:
+    """Test using an unavailable YAML backend."""
+    env.copier_yaml_backend = "unknown"  # type: ignore[attr-defined]
+    with pytest.raises(ValueError, match='YAML backend "unknown" is not available'):
+        render(env, f"[[ v | {filter_call} ]]", v="k: v")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from re import escape
 from typing import Any
 
@@ -21,7 +23,9 @@ from jinja2_copier_extension import CopierExtension
         "b64encode",
         "basename",
         "bool",
+        "bool_each",
         "checksum",
+        "digest",
         "dirname",
         "expanduser",
         "expandvars",
@@ -29,13 +33,20 @@ from jinja2_copier_extension import CopierExtension
         "fileglob",
         "flatten",
         "from_json",
+        "from_jsonl",
         "from_yaml",
         "from_yaml_all",
         "hash",
+        "hash_chunks",
+        "hash_each",
+        "hash_file",
         "mandatory",
         "md5",
+        "md5_file",
         "quote",
         "random_mac",
+        "random_mac_pool",
+        "random_sample",
         "realpath",
         "regex_escape",
         "regex_findall",
@@ -43,6 +54,7 @@ from jinja2_copier_extension import CopierExtension
         "regex_search",
         "relpath",
         "sha1",
+        "sha1_file",
         "shuffle",
         "splitext",
         "strftime",
@@ -79,3 +91,33 @@ def test_filter_name_conflict(name: str) -> None:
         env = Environment(extensions=[_TestExtension, CopierExtension])
 
     assert env.filters[name] == _fake_filter
+
+
+def test_import_is_lazy() -> None:
+    """Test that loading the extension does not import the filter modules.
+
+    The filter modules and their dependencies must only be imported on first use of
+    a filter to keep the startup time of short-lived processes low.
+    """
+    code = (
+        "import jinja2, jinja2_copier_extension as e;"
+        "jinja2.Environment(extensions=[e.CopierExtension])"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    imported = {
+        line.rpartition("|")[2].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    assert "jinja2_copier_extension.extension" in imported
+    assert not {
+        module
+        for module in imported
+        if module.startswith("jinja2_copier_extension._filters")
+        or module.split(".")[0] in {"base64", "datetime", "shlex", "uuid", "yaml"}
+    }
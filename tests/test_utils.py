@@ -0,0 +1,46 @@
+"""Tests for utility functions."""
+
+from __future__ import annotations
+
+from jinja2_copier_extension._utils import CacheInfo
+from jinja2_copier_extension._utils import LRUCache
+
+
+def test_lru_cache_eviction() -> None:
+    """Test that the least recently used entry is evicted first."""
+    cache: LRUCache[str, str] = LRUCache(maxsize=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert cache.get("a") == "A"
+    cache.put("c", "C")
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    assert cache.cache_info() == CacheInfo(hits=3, misses=1, maxsize=2, currsize=2)
+
+
+def test_lru_cache_resize_and_clear() -> None:
+    """Test shrinking and clearing the cache."""
+    cache: LRUCache[str, str] = LRUCache(maxsize=3)
+    for key in "abc":
+        cache.put(key, key.upper())
+    cache.maxsize = 1
+    assert cache.get("a") is None
+    assert cache.get("c") == "C"
+    cache.cache_clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=1, currsize=0)
+
+
+def test_lru_cache_peek_and_record() -> None:
+    """Test looking up entries without counting them and counting them explicitly."""
+    cache: LRUCache[str, str] = LRUCache(maxsize=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert cache.peek("a") == "A"
+    assert cache.peek("c") is None
+    cache.put("c", "C")
+    assert cache.peek("b") is None
+    cache.record(hit=True)
+    cache.record(hit=False)
+    cache.record(hit=False)
+    assert cache.cache_info() == CacheInfo(hits=1, misses=2, maxsize=2, currsize=2)